@@ -2,97 +2,146 @@
 
 """Chapter 3: Modeling & Evaluation - From Statistics to Deep Learning"""
 
+import json
+from functools import cache, partial
+from pathlib import Path
+
 import reflex as rx
 from goldsight.components import page_layout, chapter_progress
 
+# Static files served at the site root (plots under /modeling_plots/...).
+_ASSETS_DIR = Path(__file__).parent.parent.parent / "assets"
+
 # ======================================================================
-# HELPER COMPONENTS
+# STYLE CONSTANTS
 # ======================================================================
 
-def section_divider() -> rx.Component:
-    """Visual divider between sections."""
-    return rx.divider(margin_y="1.5em")
+class _C:
+    """Radix palette tokens used on this page, resolved once at import."""
 
+    gray_1 = rx.color("gray", 1)
+    gray_5 = rx.color("gray", 5)
+    gray_8 = rx.color("gray", 8)
+    amber_1 = rx.color("amber", 1)
+    amber_2 = rx.color("amber", 2)
+    amber_5 = rx.color("amber", 5)
+    amber_6 = rx.color("amber", 6)
+    amber_9 = rx.color("amber", 9)
+    amber_10 = rx.color("amber", 10)
+    blue_1 = rx.color("blue", 1)
+    blue_2 = rx.color("blue", 2)
+    blue_5 = rx.color("blue", 5)
+    blue_6 = rx.color("blue", 6)
+    blue_9 = rx.color("blue", 9)
+    blue_10 = rx.color("blue", 10)
+    cyan_9 = rx.color("cyan", 9)
+    green_2 = rx.color("green", 2)
+    green_9 = rx.color("green", 9)
+    green_10 = rx.color("green", 10)
+    orange_10 = rx.color("orange", 10)
+    purple_1 = rx.color("purple", 1)
+    purple_2 = rx.color("purple", 2)
+    purple_5 = rx.color("purple", 5)
+    purple_6 = rx.color("purple", 6)
+    purple_9 = rx.color("purple", 9)
+    purple_10 = rx.color("purple", 10)
+    red_9 = rx.color("red", 9)
+    red_10 = rx.color("red", 10)
+
+
+# Left-accent borders for callout boxes, keyed by (hue, shade, width in px).
+_BORDERS = {
+    ("amber", 9, 4): f"4px solid {_C.amber_9}",
+    ("blue", 9, 4): f"4px solid {_C.blue_9}",
+    ("cyan", 9, 4): f"4px solid {_C.cyan_9}",
+    ("green", 9, 4): f"4px solid {_C.green_9}",
+    ("purple", 9, 4): f"4px solid {_C.purple_9}",
+    ("red", 9, 4): f"4px solid {_C.red_9}",
+}
+
+
+@cache
+def _color(hue: str, shade: int):
+    """Palette token for a hue only known at call time (e.g. a color_scheme argument)."""
+    return rx.color(hue, shade)
 
-def model_badge(rank: int, model_name: str) -> rx.Component:
-    """Badge showing model ranking."""
-    colors = {1: "amber", 2: "gray", 3: "orange"}
-    icons = {1: "trophy", 2: "medal", 3: "award"}
-    return rx.hstack(
-        rx.icon(icons.get(rank, "circle"), size=16, color=rx.color(colors.get(rank, "gray"), 9)),
-        rx.text(model_name, size="2", weight="bold"),
-        spacing="1",
-        align="center"
-    )
 
+@cache
+def _lift_hover(hue: str) -> dict:
+    """Hover style for metric cards: tinted border and a slight lift. Shared, never mutated."""
+    return {
+        "border_color": _color(hue, 6),
+        "transform": "translateY(-2px)",
+        "box_shadow": "0 4px 12px rgba(0, 0, 0, 0.1)"
+    }
+
+
+# Row style for highlighted table rows; one shared instance, never mutated.
+_HIGHLIGHT_STYLE = {"background": _C.green_2, "font_weight": "bold"}
+
+# Full-width grids with the layout kwargs this page uses most often.
+_grid3 = partial(rx.grid, columns="3", spacing="3", width="100%")
+_grid2 = partial(rx.grid, columns="2", spacing="3", width="100%")
+
+# Markdown bullet lists rendered with the same props as the page's rx.unordered_list blocks.
+_LIST_MAP = {
+    "ul": lambda items: rx.unordered_list(items, spacing="2", padding_left="1.5em"),
+    "li": lambda text: rx.list_item(text),
+    "strong": lambda text: rx.text.strong(text),
+}
+
+# ======================================================================
+# HELPER COMPONENTS
+# ======================================================================
 
 def metric_card(label: str, value: str, color_scheme: str = "blue", description: str = "") -> rx.Component:
     """Display a single metric card."""
     return rx.box(
         rx.vstack(
             rx.text(label, size="2", color="var(--gray-12)", weight="medium"),
-            rx.heading(value, size="7", weight="bold", color=rx.color(color_scheme, 10)),
-            rx.cond(
-                description != "",
-                rx.text(description, size="1", color="var(--gray-10)"),
-                rx.fragment()
-            ),
+            rx.heading(value, size="7", weight="bold", color=_color(color_scheme, 10)),
+            rx.text(description, size="1", color="var(--gray-10)") if description else rx.fragment(),
             spacing="1",
             align="center"
         ),
         padding="1.25em",
         border="1px solid",
-        border_color=rx.color("gray", 5),
+        border_color=_C.gray_5,
         border_radius="var(--radius-3)",
-        background=rx.color(color_scheme, 1),
+        background=_color(color_scheme, 1),
         width="100%",
-        _hover={
-            "border_color": rx.color(color_scheme, 6),
-            "transform": "translateY(-2px)",
-            "box_shadow": "0 4px 12px rgba(0, 0, 0, 0.1)"
-        },
+        _hover=_lift_hover(color_scheme),
         transition="all 0.2s ease"
     )
 
 
-def comparison_table_section(title: str, description: str, data: list, highlight_best: bool = True) -> rx.Component:
+def _metric_grid(specs: tuple, **props) -> rx.Component:
+    """One row of metric cards, a column per (label, value, color scheme, description) spec."""
+    return rx.grid(
+        *[metric_card(*spec) for spec in specs],
+        columns=str(len(specs)),
+        spacing="3",
+        width="100%",
+        **props
+    )
+
+
+def _badge(text: str, color_scheme: str, size: str = "2") -> rx.Component:
+    """Table badge with the page's default size."""
+    return rx.badge(text, color_scheme=color_scheme, size=size)
+
+
+def comparison_table_section(title: str, description: str, data: list | tuple, highlight_best: bool = True) -> rx.Component:
     """Reusable comparison table with metrics."""
     
-    # Find best model (highest R²)
-    best_idx = 0
-    if highlight_best and len(data) > 0:
-        best_r2 = max([float(row[1].replace("−", "-")) for row in data])  # Handle negative sign
-        best_idx = next(i for i, row in enumerate(data) if float(row[1].replace("−", "-")) == best_r2)
+    # Parse each R² once; it drives both the badge color and the best-model highlight
+    r2_values = [float(row[1]) for row in data]  # Table data uses ASCII minus
+    best_idx = r2_values.index(max(r2_values)) if highlight_best and r2_values else -1
     
-    table_rows = []
-    for idx, row in enumerate(data):
-        is_best = idx == best_idx and highlight_best
-        row_style = {
-            "background": rx.color("green", 2) if is_best else "transparent",
-            "font_weight": "bold" if is_best else "normal"
-        }
-        
-        table_rows.append(
-            rx.table.row(
-                rx.table.cell(
-                    rx.hstack(
-                        rx.text(row[0]),
-                        rx.cond(
-                            is_best,
-                            rx.icon("trophy", size=16, color=rx.color("amber", 9)),
-                            rx.fragment()
-                        ),
-                        spacing="2",
-                        align="center"
-                    )
-                ),
-                rx.table.cell(rx.badge(row[1], color_scheme="green" if float(row[1].replace("−", "-")) > 0.9 else "gray", size="2")),
-                rx.table.cell(row[2]),
-                rx.table.cell(row[3]),
-                rx.table.cell(row[4]),
-                style=row_style
-            )
-        )
+    table_rows = [
+        _model_row(*row, "green" if r2 > 0.9 else "gray", best=idx == best_idx)
+        for idx, (row, r2) in enumerate(zip(data, r2_values))
+    ]
     
     return rx.vstack(
         rx.heading(title, size="6", weight="bold", margin_bottom="0.5em"),
@@ -121,32 +170,609 @@ def comparison_table_section(title: str, description: str, data: list, highlight
     )
 
 
-def insight_box(icon: str, title: str, content: str, color_scheme: str = "blue") -> rx.Component:
-    """Insight highlight box."""
+def _card(*children, tone: str = "gray", spacing: str = "2", **props) -> rx.Component:
+    """Bordered content card: tinted background with a matching 1px border.
+
+    The card is itself the vertical stack, so it adds one layout box, not two.
+    """
+    props = {
+        "padding": "1.5em",
+        "border": "1px solid",
+        "border_color": _color(tone, 5),
+        "border_radius": "var(--radius-4)",
+        **props,
+    }
+    return rx.vstack(
+        *children,
+        spacing=spacing,
+        align="start",
+        background=_color(tone, 1),
+        **props
+    )
+
+
+def _callout(*children, tone: str, spacing: str = "2", **props) -> rx.Component:
+    """Callout box with a 4px accent bar on the left."""
+    props = {"padding": "1.25em", "border_radius": "var(--radius-3)", **props}
+    return rx.vstack(
+        *children,
+        spacing=spacing,
+        align="start",
+        background=_color(tone, 2),
+        border_left=_BORDERS[tone, 9, 4],
+        **props
+    )
+
+
+def _coef_row(feature: str, coefficient: str, p_value: str, ci: str, note: str) -> rx.Component:
+    """OLS coefficient table row; significant features (p < 0.05) are highlighted."""
+    row, cell = rx.table.row, rx.table.cell
+    significant = float(p_value) < 0.05
+    return row(
+        cell(feature),
+        cell(coefficient),
+        cell(_badge(p_value, "green" if significant else "gray")),
+        cell(ci),
+        cell(note),
+        style=_HIGHLIGHT_STYLE if significant else {}
+    )
+
+
+def _vif_row(feature: str, vif: str, status: str, color_scheme: str, note: str) -> rx.Component:
+    """VIF table row; values above the VIF > 10 threshold are emphasised."""
+    row, cell = rx.table.row, rx.table.cell
+    return row(
+        cell(feature),
+        cell(
+            rx.heading(vif, size="4", color=_color(color_scheme, 10)) if float(vif) > 10 else vif
+        ),
+        cell(_badge(status, color_scheme)),
+        cell(note),
+    )
+
+
+def _diag_card(title: str, label: str, value: str, tone: str, subtext: str, verdict: str, verdict_tone: str) -> rx.Component:
+    """Regression diagnostic card: headline statistic plus a one-line verdict."""
     return rx.box(
-        rx.hstack(
-            rx.icon(icon, size=48, color=rx.color(color_scheme, 9)),
-            rx.vstack(
-                rx.heading(title, size="4", weight="bold"),
-                rx.text(content, size="3", color="var(--gray-12)", line_height="1.7"),
+        rx.vstack(
+            rx.text.strong(title),
+            rx.divider(margin_y="0.5em"),
+            rx.hstack(
+                rx.text(label, size="2", color="var(--gray-11)"),
+                rx.heading(value, size="5", color=_color(tone, 10)),
                 spacing="2",
-                align="start"
+                align="center"
             ),
-            spacing="3",
+            rx.text(subtext, size="2", color="var(--gray-12)"),
+            rx.text(verdict, size="2", color=_color(verdict_tone, 10), weight="bold"),
+            spacing="2",
             align="start"
         ),
         padding="1.25em",
-        background=rx.color(color_scheme, 2),
-        border_left=f"4px solid {rx.color(color_scheme, 9)}",
+        background=_color(tone, 1),
+        border="1px solid",
+        border_color=_color(tone, 5),
+        border_radius="var(--radius-3)"
+    )
+
+
+def _ridge_metric_row(model: str, r2: str, adj_r2: str, mse: str, rmse: str, mae: str) -> rx.Component:
+    """Linear vs Ridge metrics row; R² columns shown as badges."""
+    row, cell = rx.table.row, rx.table.cell
+    return row(
+        cell(model),
+        cell(_badge(r2, "green")),
+        cell(_badge(adj_r2, "green")),
+        cell(mse),
+        cell(rmse),
+        cell(mae),
+    )
+
+
+def _ridge_coef_row(feature: str, linear: str, ridge: str) -> rx.Component:
+    """Linear vs Ridge coefficient row."""
+    row, cell = rx.table.row, rx.table.cell
+    return row(cell(feature), cell(linear), cell(ridge))
+
+
+def _model_row(model: str, r2: str, rmse: str, mae: str, notes: str, tone: str, best: bool = False) -> rx.Component:
+    """Model comparison row; the best model gets a trophy and highlight."""
+    row, cell = rx.table.row, rx.table.cell
+    return row(
+        cell(
+            rx.hstack(
+                rx.text(model),
+                rx.icon("trophy", size=16, color=_C.amber_9) if best else rx.fragment(),
+                spacing="2",
+                align="center"
+            )
+        ),
+        cell(_badge(r2, tone)),
+        cell(rmse),
+        cell(mae),
+        cell(notes),
+        style=_HIGHLIGHT_STYLE if best else {}
+    )
+
+
+def _leaderboard_row(rank: int, model: str, r2: str, rmse: str, mae: str, category: str, tone: str,
+                     highlight: bool = False) -> rx.Component:
+    """Grand comparison row; top-ranked rows are highlighted."""
+    row, cell = rx.table.row, rx.table.cell
+    return row(
+        cell(str(rank)),
+        cell(model),
+        cell(_badge(r2, tone)),
+        cell(rmse),
+        cell(mae),
+        cell(category),
+        style=_HIGHLIGHT_STYLE if highlight else {}
+    )
+
+
+def _pipeline_step(title: str, detail: str, note: str) -> rx.Component:
+    """One stage of an architecture pipeline; wraps below 180px instead of squeezing."""
+    return rx.vstack(
+        rx.text.strong(title),
+        rx.text(detail, size="2", color="var(--gray-12)"),
+        rx.text(note, size="2", color="var(--gray-10)"),
+        align="start",
+        flex="1 1 180px"
+    )
+
+
+def _pipeline(steps: tuple) -> list:
+    """Pipeline stages joined by arrow icons."""
+    out = [_pipeline_step(*steps[0])]
+    for step in steps[1:]:
+        out += [rx.icon("arrow-right", size=24, color=_C.gray_8), _pipeline_step(*step)]
+    return out
+
+
+def _term_item(term: str, description: str, muted: bool = False) -> rx.Component:
+    """Bold term with a one-line description underneath."""
+    return rx.vstack(
+        rx.text.strong(term),
+        rx.text(description, size="2", color="var(--gray-10)" if muted else "var(--gray-12)"),
+        align="start"
+    )
+
+
+def _param_item(name: str, description: str) -> rx.Component:
+    """Model parameter name with a short explanation underneath."""
+    return rx.vstack(
+        rx.text.strong(name),
+        rx.text(description, size="2", color="var(--gray-12)", line_height="1.6"),
+        align="start",
+        spacing="1"
+    )
+
+
+# Every PNG starts with this signature, followed by the IHDR chunk holding width and height.
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+@cache
+def _png_aspect_ratio(src: str) -> str | None:
+    """CSS aspect ratio of a PNG under assets/, read from its IHDR header."""
+    try:
+        with open(_ASSETS_DIR / src.lstrip("/"), "rb") as f:
+            header = f.read(24)
+    except OSError:
+        return None
+    if len(header) < 24 or header[:8] != _PNG_SIGNATURE or header[12:16] != b"IHDR":
+        return None
+    width, height = int.from_bytes(header[16:20], "big"), int.from_bytes(header[20:24], "big")
+    if not (width and height):
+        return None
+    return f"{width} / {height}"
+
+
+def _plot_image(src: str, **props) -> rx.Component:
+    """Framed plot image; loads lazily and reserves its intrinsic aspect ratio."""
+    ratio = _png_aspect_ratio(src)
+    if ratio:
+        props.setdefault("aspect_ratio", ratio)
+    props = {"border": "1px solid", "border_color": _C.gray_5, **props}
+    return rx.image(
+        src=src,
+        width="100%",
         border_radius="var(--radius-3)",
-        margin_bottom="1em"
+        loading="lazy",
+        decoding="async",
+        **props
+    )
+
+
+def _md_list(markdown: str) -> rx.Component:
+    """Markdown bullet list styled like a hand-built rx.unordered_list."""
+    return rx.markdown(markdown, component_map=_LIST_MAP)
+
+
+# Plain text, or a (bold lead, rest) pair.
+_Text = str | tuple[str, str]
+
+
+def _lead_text(text: _Text) -> tuple:
+    """Text parts; a (lead, rest) pair renders its lead in bold."""
+    if isinstance(text, tuple):
+        lead, rest = text
+        return rx.text.strong(lead), rest
+    return (text,)
+
+
+def _plot_panel(heading: str, image: rx.Component, caption: _Text, **props) -> rx.Component:
+    """Plot image with a small heading above and a centred caption below."""
+    return rx.vstack(
+        rx.heading(heading, size="3", weight="bold", margin_bottom="0.5em"),
+        image,
+        rx.text(*_lead_text(caption), size="2", color="var(--gray-11)", text_align="center", margin_top="0.5em"),
+        spacing="2",
+        **props
+    )
+
+
+def _dl_model_tab(folder: str, icon: str, tone: str, title: str, summary: _Text, loss_heading: str,
+                  loss_caption: _Text, pred_caption: _Text, fit_caption: _Text,
+                  champion: bool = False) -> rx.Component:
+    """Deep learning model tab: training loss plot above the two prediction plots.
+
+    The champion tab gets a larger icon and a heavier amber frame on the card and plots.
+    """
+    plots = f"/modeling_plots/{folder}"
+    frame = {"border": "2px solid", "border_color": _C.amber_6} if champion else {}
+    return _card(
+        rx.hstack(
+            rx.icon(icon, size=28 if champion else 24, color=_color(tone, 9)),
+            rx.heading(title, size="4", weight="bold", color=_color(tone, 10)),
+            spacing="2",
+            align="center",
+            margin_bottom="0.5em"
+        ),
+        rx.text(*_lead_text(summary), size="2", color="var(--gray-11)", margin_bottom="1em"),
+        _plot_panel(loss_heading, _plot_image(f"{plots}/training_loss.png", **frame), loss_caption, margin_bottom="1em"),
+        _grid2(
+            _plot_panel("Predictions vs Actual", _plot_image(f"{plots}/pred_actual.png", **frame), pred_caption, align="start"),
+            _plot_panel("Linear Fit Analysis", _plot_image(f"{plots}/pred_actual_linefit.png", **frame), fit_caption, align="start")
+        ),
+        tone=tone,
+        spacing="3",
+        **frame
     )
 
 
+# ======================================================================
+# STATIC CONTENT
+# ======================================================================
+
+# Divider between page sections; one instance, placed between every pair of sections.
+_SECTION_DIVIDER = rx.divider(margin_y="1.5em")
+
+# Multiple regression summary: fixed results, built once at import.
+_MULTIPLE_HEADER = rx.text(
+    "Now we use all 13 features simultaneously. This allows the model to capture interactions between variables "
+    "(e.g., inflation and interest rates together affecting gold). Results: ",
+    rx.text.strong("R² = 0.947"), ", ",
+    rx.text.strong("RMSE = $115.88"), ", ",
+    rx.text.strong("MAE = $77.06"), ".",
+    size="4",
+    color="var(--gray-12)",
+    line_height="1.7",
+    margin_bottom="1.5em"
+)
+
+_MULTIPLE_METRICS = _metric_grid(
+    (
+        ("R²", "0.947", "green", "95% variance explained"),
+        ("RMSE", "$115.88", "purple", "Typical error"),
+        ("MAE", "$77.06", "amber", "Average deviation"),
+    ),
+    margin_y="1em"
+)
+
+_DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def _load_data(name: str):
+    """Parse a result table shipped in goldsight/data/ (read once, at import)."""
+    return json.loads((_DATA_DIR / name).read_text(encoding="utf-8"))
+
+
+# Multiple regression result tables live in data/ so numbers update without layout edits.
+_MULTIPLE_DATA = _load_data("multiple_regression.json")
+
+# OLS coefficients: (feature, coefficient, p-value, 95% CI, note).
+_COEF_ROWS = tuple(map(tuple, _MULTIPLE_DATA["coef"]))
+
+# Variance inflation factors: (feature, VIF, status, color scheme, note).
+_VIF_ROWS = tuple(map(tuple, _MULTIPLE_DATA["vif"]))
+
+# Diagnostic cards: (title, label, value, tone, subtext, verdict, verdict tone).
+_DIAG_CARDS = tuple(map(tuple, _MULTIPLE_DATA["diag"]))
+
+
+# Bullet lists for the three tabs, rendered as markdown.
+_KEY_FINDINGS_MD = """\
+- **6 significant features (p < 0.05):** Silver, Unemployment, CPI, S&P500, USD Index, Crude Oil
+- **Unemployment coefficient (+32.04):** When unemployment increase -> gold increase (safe haven during economic stress)
+- **Crude Oil negative (-2.20):** Counterintuitive, likely due to multicollinearity with CPI
+- **7 non-significant features:** VIX, interest rates, geopolitical indices (redundant in Multiple context)
+"""
+
+_DIAG_INTERPRETATION_MD = """\
+- **Strong overall fit:** F-statistic = **312.9** confirms the model explains variance **significantly better than the null model**
+- **No autocorrelation:** Durbin-Watson = **2.221 ~ 2.0** means **residuals are independent** (good for regression assumptions)
+- **Non-normal residuals:** Skew = **0.928**, Kurtosis = **10.38** indicate **heavy-tailed distribution**. This affects t-test/F-test reliability.
+- **Multicollinearity present:** Condition number = **99,000** suggests some features are highly correlated (e.g., CPI <-> M2, S&P <-> NASDAQ removed earlier)
+- **Solution:** Use Ridge regression or remove non-significant features to reduce multicollinearity
+"""
+
+_VIF_ASSESSMENT_MD = """\
+- **Severe multicollinearity (VIF > 100):** CPI (1805.21), USD Index (1012.78), and Treasury Yield (179.92) show extreme correlation with other macroeconomic variables
+- **High multicollinearity (VIF 30-100):** Crude Oil (76.45), GPR (50.16), S&P 500 (48.05), Silver Futures (33.21), GPRA (32.72), and Real Interest Rate (30.81)
+- **Moderate multicollinearity (VIF 10-30):** Unemployment (23.61) and VIX (11.45) indicate some correlation with other features
+- **Low multicollinearity (VIF < 10):** Only Fed Funds Rate (9.87) falls below the traditional threshold, suggesting relatively independent behavior
+- **Ridge regression test:** Applied L2 regularization showed no improvement (**R² = 0.947** identical to OLS), indicating that while multicollinearity exists, it does not significantly degrade predictive performance
+- **Modeling decision:** Retained all features despite high VIF values. The multicollinearity reflects genuine economic relationships (e.g., inflation driving both CPI and USD strength). Removing features would sacrifice valuable information without meaningful performance gains.
+"""
+
+# Key takeaways, item 8: what we would change with hindsight.
+_HINDSIGHT_MD = """\
+- Ensemble methods: Stack top 3 models (GRU, LSTM, Random Forest) for robustness
+- Attention mechanisms: Add attention layers to GRU to identify key timesteps
+- Hyperparameter tuning: Use Optuna for automated Bayesian optimization
+- Cross-validation: Implement time-series CV instead of single train/test split
+- Regime detection: Train separate models for bull/bear/crisis periods
+- Exogenous shocks: Add binary flags for major events (Fed pivots, crises)
+"""
+
+
+# Metrics every model is scored on: (metric, plain-language meaning).
+_EVAL_CRITERIA = (
+    ("R² (Coefficient of Determination)", "How much of the gold price's movement can our model explain? (Scale: 0 to 1. Higher is better)."),
+    ("RMSE (Root Mean Squared Error)", "Average prediction error in dollars. Lower is better."),
+    ("MAE (Mean Absolute Error)", "What is our average error, in dollars? (e.g., 'On average, the model is off by $35')."),
+)
+
+# One-feature linear regressions, best first: (feature, R², RMSE, MAE, interpretation).
+_SIMPLE_ROWS = (
+    ("CPI", "0.720", "$266.74", "$210.61", "Strongest single predictor"),
+    ("S&P_500", "0.619", "$311.12", "$240.87", "Stock market correlation"),
+    ("Silver_Futures", "0.526", "$346.97", "$274.55", "Precious metal co-movement"),
+    ("USD_Index", "0.361", "$402.80", "$326.55", "Currency strength impact"),
+    ("GPR", "0.193", "$452.57", "$368.78", "Geopolitical risk factor"),
+    ("GPRA", "0.083", "$482.24", "$382.14", "Action-based risk"),
+    ("Real_Interest_Rate", "0.079", "$483.29", "$352.45", "Moderate predictive power"),
+    ("Treasury_Yield_10Y", "0.053", "$490.13", "$374.42", "Weak linear relationship"),
+    ("VIX", "-0.020", "$508.61", "$403.34", "Near-zero linear fit"),
+    ("Unemployment", "-0.002", "$504.21", "$400.82", "Near-zero linear fit"),
+    ("Crude_Oil", "0.001", "$503.37", "$391.79", "Near-zero linear fit"),
+    ("Fed_Funds_Rate", "-0.043", "$514.37", "$400.19", "Weak negative fit"),
+)
+
+# Linear vs Ridge test metrics: (model, R², adj R², MSE, RMSE, MAE).
+_RIDGE_METRICS = (
+    ("Linear Regression", "0.947", "0.928", "13427.07", "115.88", "77.06"),
+    ("Ridge Regression", "0.947", "0.928", "13427.07", "115.88", "77.06"),
+)
+
+# Linear vs Ridge coefficients: (feature, linear, ridge).
+_RIDGE_COEFS = (
+    ("Silver_Futures", "25.49", "25.79"),
+    ("Unemployment", "32.04", "24.39"),
+    ("CPI", "10.20", "10.73"),
+    ("VIX", "1.51", "2.22"),
+    ("S&P_500", "0.10", "0.09"),
+    ("GPR", "0.22", "0.06"),
+    ("GPRA", "0.08", "0.04"),
+    ("Crude_Oil", "-2.20", "-2.86"),
+    ("Fed_Funds_Rate", "5.12", "-4.88"),
+    ("Real_Interest_Rate", "24.05", "-5.09"),
+    ("Treasury_Yield_10Y", "-52.38", "-8.13"),
+    ("USD_Index", "-7.84", "-8.35"),
+)
+
+# ARIMA (p, d, q) and seasonal (P, D, Q, s) parameters: (name, description).
+_ARIMA_PARAMS = (
+    ("p (AutoRegressive order)",
+     "Number of past time steps (lags) used to predict the current value. "
+     "For ARIMA(1,1,1), p=1 means the model uses the previous month's price to predict the next month."),
+    ("d (Differencing order)",
+     "Number of times the series is differenced to make it stationary (remove trends). "
+     "d=1 means we model the change in gold price (first derivative) rather than raw prices."),
+    ("q (Moving Average order)",
+     "Number of past forecast errors used to correct predictions. "
+     "q=1 means the model learns from the previous prediction error to improve the next forecast."),
+)
+
+_SARIMA_PARAMS = (
+    ("P (Seasonal AR)", "Uses prices from 12 months ago (P=1)"),
+    ("D (Seasonal Differencing)", "Removes yearly trends (D=1)"),
+    ("Q (Seasonal MA)", "Corrects using errors from 12 months ago (Q=1)"),
+    ("s (Seasonal period)", "12 months - captures annual patterns"),
+)
+
+# Baseline models: (model, R², RMSE, MAE, notes, R² badge color).
+_BASELINE_ROWS = (
+    ("Linear Regression", "0.947", "$115.88", "$77.06", "Strong Multiple baseline", "green"),
+    ("Ridge Regression", "0.947", "$115.88", "$77.06", "No improvement", "green"),
+    ("Polynomial (degree=2)", "0.537", "$342.78", "$270.69", "Best simple: Silver", "blue"),
+    ("ARIMA (1,1,1)", "-0.480", "$503.12", "$321.93", "Failed - worse than mean", "red"),
+    ("SARIMA (1,1,1)x(1,1,1,12)", "0.270", "$353.57", "$233.26", "Poor - weak seasonality", "blue"),
+)
+
+# Traditional ML models: (model, R², RMSE, MAE, notes).
+_ML_ROWS = (
+    ("Support Vector Regression (SVR)", "0.986", "$59.93", "$43.77", "GridSearch: C=100, gamma=0.01"),
+    ("Random Forest", "0.974", "$80.46", "$55.39", "500 trees, depth=20, 1620 CV fits"),
+    ("XGBoost", "0.973", "$82.67", "$51.11", "Slightly underperformed than others"),
+)
+
+# Deep learning on gold price history only: (model, R², RMSE, MAE, notes).
+_DL_SIMPLE_ROWS = (
+    ("MLP (Feedforward)", "0.960", "$100.62", "$78.85", "256->128->64->32 neurons, Dropout"),
+    ("GRU (One - One)", "0.843", "$164.93", "$122.95", "64->64 units, window=12"),
+    ("LSTM (One - One)", "0.603", "$262.55", "$193.85", "64->64 units, gates struggle"),
+    ("RNN (One - One)", "0.600", "$263.33", "$184.26", "Simple RNN insufficient"),
+)
+
+# Deep learning on price history plus macro features: (model, R², RMSE, MAE, notes).
+_DL_MULTI_ROWS = tuple(map(tuple, _load_data("deep_learning_multiple.json")))
+
+# Many-One headline numbers: (label, value, color scheme, description).
+_DL_MULTI_METRICS = (
+    ("R² Improvement", "+0.147", "green", "vs RNN simple"),
+    ("Error Reduction", "-79%", "blue", "MAE: $184 -> $35"),
+    ("Training Time", "~5 min", "purple", "70 epochs with EarlyStopping"),
+    ("Parameters", "~50K", "amber", "128->64 GRU units"),
+)
+
+# GRU Many-One architecture, left to right: (stage, shape/config, note).
+_GRU_MULTI_PIPELINE = (
+    ("Input Layer", "Shape: (batch, 12, 13)", "12 timesteps x 13 features"),
+    ("GRU Layer 1", "128 units, return sequences", "Dropout: 0.2"),
+    ("GRU Layer 2", "64 units, final state", "Captures long-term patterns"),
+    ("Dense Layers", "Dense(32, ReLU) -> Dense(1)", "Final prediction"),
+)
+
+# Every model tested, best first: (model, R², RMSE, MAE, category).
+_ALL_MODELS_ROWS = (
+    ("GRU Multiple", "0.990", "$45.92", "$34.94", "Top performer - best overall"),
+    ("LSTM Multiple", "0.990", "$45.31", "$37.84", "Nearly tied with GRU"),
+    ("SVR (RBF Kernel)", "0.986", "$59.93", "$43.77", "Best traditional ML"),
+    ("Random Forest", "0.986", "$59.93", "$43.77", "Tied with SVR"),
+    ("XGBoost", "0.973", "$82.67", "$51.11", "Gradient boosting"),
+    ("RNN Multiple", "0.972", "$76.77", "$58.99", "Good but simpler"),
+    ("MLP", "0.960", "$100.62", "$78.85", "Feedforward baseline"),
+    ("Linear Regression", "0.947", "$115.88", "$77.06", "Strong baseline"),
+    ("Ridge Regression", "0.947", "$115.88", "$77.06", "No improvement"),
+    ("GRU simple", "0.843", "$164.93", "$122.95", "Needs features"),
+    ("LSTM simple", "0.603", "$262.55", "$193.85", "Insufficient"),
+    ("RNN simple", "0.600", "$263.33", "$184.26", "Insufficient"),
+    ("SARIMA", "0.270", "$353.57", "$233.26", "Time series weak"),
+    ("ARIMA", "-0.480", "$503.12", "$321.93", "Failed completely"),
+)
+
+# Leaderboard tier by rank: (badge tone, highlight). Top two green and highlighted, next three blue.
+_ALL_MODELS_TIERS = tuple(
+    ("green" if i < 2 else "blue" if i < 5 else "gray", i < 2) for i in range(len(_ALL_MODELS_ROWS))
+)
+
+# GRU Many-One training setup: (setting, note).
+_GRU_MULTI_TRAINING = (
+    ("Optimizer: Adam", "Adaptive learning rate"),
+    ("Loss: MSE", "Mean Squared Error"),
+    ("Callbacks: 3", "EarlyStopping, ReduceLR, Checkpoint"),
+    ("Batch Size: 32", "Balanced speed/stability"),
+)
+
+# Simple deep learning tabs: (tab value, label, plot folder, icon, tone, title,
+# summary, loss heading, loss caption, pred-vs-actual caption, line-fit caption).
+_DL_SIMPLE_TABS = (
+    (
+        "mlp",
+        "MLP",
+        "mlp",
+        "layers",
+        "blue",
+        "MLP (Multilayer Perceptron) - R² = 0.960",
+        "Best simple performer using all 13 features simultaneously (256→128→64→32 architecture with Dropout & BatchNorm).",
+        "Training History",
+        "MLP converges quickly with smooth loss reduction. Validation loss stabilizes around epoch 30, indicating good generalization.",
+        "Strong correlation between predicted and actual values (R² = 0.960).",
+        "Regression line demonstrates MLP's ability to capture the full range of gold prices accurately.",
+    ),
+    (
+        "rnn",
+        "RNN",
+        "rnn",
+        "git-branch",
+        "purple",
+        "RNN (Recurrent Neural Network) - R² = 0.600",
+        "Simple RNN struggles with vanishing gradients. Only sees past gold prices (window=12), lacks economic context.",
+        "Training Loss",
+        "RNN struggles with vanishing gradients - loss plateaus early. Limited capacity to capture long-term dependencies.",
+        "Wide scatter indicates poor fit (R² = 0.600). RNN fails to capture gold's complex dynamics from price history alone.",
+        "Regression line deviates significantly from ideal y=x, confirming systematic prediction errors.",
+    ),
+    (
+        "lstm",
+        "LSTM",
+        "lstm",
+        "boxes",
+        "green",
+        "LSTM (Long Short-Term Memory) - R² = 0.603",
+        "LSTM's 3-gate architecture (input, forget, output) shows marginal improvement over RNN but still struggles without economic features.",
+        "Training Loss",
+        "LSTM's gating mechanisms show slightly better convergence than RNN, but still struggles without economic features (R² = 0.603).",
+        "LSTM performs marginally better than RNN but still shows significant prediction errors without Multiple features.",
+        "Gates help with memory but cannot compensate for missing economic context. Fit remains poor.",
+    ),
+    (
+        "gru",
+        "GRU",
+        "gru",
+        "circuit-board",
+        "amber",
+        "GRU (Gated Recurrent Unit) - R² = 0.843",
+        "Best simple recurrent model! GRU's simplified 2-gate design (reset + update) proves more effective than LSTM for limited data.",
+        "Training Loss",
+        "GRU achieves best simple performance (R² = 0.843) with efficient 2-gate architecture. Simpler than LSTM but more effective for limited data.",
+        "Tighter cluster than RNN/LSTM, showing GRU's superior ability to learn temporal patterns from simple gold prices.",
+        "Best simple recurrent model, but still limited without economic features. Sets stage for Multiple improvements.",
+    ),
+)
+
+# Many-to-one deep learning tabs: same layout as _DL_SIMPLE_TABS plus a champion flag.
+_DL_MULTI_TABS = (
+    (
+        "rnn_multi",
+        "RNN",
+        "rnn_multivariate",
+        "git-branch",
+        "purple",
+        "RNN Multiple - R² = 0.972",
+        "RNN dramatically improves from R² = 0.600 (simple) to 0.972 (Multiple) with economic features. MAE drops from $184 to $59.",
+        "Training Loss",
+        "Economic features stabilize training and reduce vanishing gradient issues. Convergence is much smoother than simple RNN.",
+        "Much tighter cluster than simple RNN. Multiple features enable RNN to capture complex gold dynamics.",
+        "Strong linear relationship demonstrates RNN's improved prediction accuracy with economic context (MAE = $58.99).",
+    ),
+    (
+        "lstm_multi",
+        "LSTM",
+        "lstm_multivariate",
+        "boxes",
+        "green",
+        "LSTM Multiple - R² = 0.990",
+        "LSTM achieves near-optimal performance (R² = 0.990, MAE = $37.84). Three-gate architecture excels at managing long-term dependencies across 13 features.",
+        "Training Loss",
+        "Smooth convergence with excellent validation performance. LSTM's memory cells effectively integrate economic signals over time.",
+        "Extremely tight scatter along diagonal - LSTM captures gold price variations with exceptional accuracy (MAE = $37.84).",
+        "Near-perfect alignment with y=x ideal line. LSTM's gates (input, forget, output) manage complex feature interactions.",
+    ),
+    (
+        "gru_multi",
+        "GRU 🏆",
+        "gru_multivariate",
+        "trophy",
+        "amber",
+        "GRU Multiple - CHAMPION (R² = 0.990)",
+        ("Best overall model! ", "R² = 0.990, MAE = $34.94 (lowest error of all models). GRU's 2-gate architecture achieves optimal balance: complex enough to excel, efficient enough to train ~20% faster than LSTM."),
+        "Training Loss",
+        ("Optimal training efficiency. ", "GRU's simplified design (reset + update gates) converges smoothly while capturing all essential temporal patterns."),
+        ("Tightest cluster of all models! ", "Lowest MAE ($34.94) demonstrates GRU's superior generalization across all price ranges."),
+        ("Perfect regression line! ", "GRU learned how CPI, interest rates, VIX, and 10 other features drive gold prices across the full historical range."),
+        True,
+    ),
+)
+
+
 # ======================================================================
 # MAIN PAGE SECTIONS
 # ======================================================================
 
+@cache
 def executive_summary() -> rx.Component:
     """Executive summary with key findings."""
     return rx.vstack(
@@ -206,8 +832,8 @@ def executive_summary() -> rx.Component:
                 align="start"
             ),
             padding="1.5em",
-            background=rx.color("purple", 2),
-            border_left=f"4px solid {rx.color('purple', 9)}",
+            background=_C.purple_2,
+            border_left=_BORDERS["purple", 9, 4],
             border_radius="var(--radius-3)"
         ),
         
@@ -218,6 +844,7 @@ def executive_summary() -> rx.Component:
     )
 
 
+@cache
 def modeling_philosophy() -> rx.Component:
     """Explain modeling approach."""
     return rx.vstack(
@@ -239,11 +866,11 @@ def modeling_philosophy() -> rx.Component:
             margin_bottom="1.5em"
         ),
         
-        rx.grid(
+        _grid3(
             rx.box(
                 rx.vstack(
                     rx.hstack(
-                        rx.icon("activity", size=32, color=rx.color("blue", 9)),
+                        rx.icon("activity", size=32, color=_C.blue_9),
                         rx.heading("1. Baseline", size="5", weight="bold"),
                         spacing="2",
                         align="center"
@@ -264,15 +891,15 @@ def modeling_philosophy() -> rx.Component:
                 ),
                 padding="1.5em",
                 border="1px solid",
-                border_color=rx.color("blue", 5),
+                border_color=_C.blue_5,
                 border_radius="var(--radius-4)",
-                background=rx.color("blue", 1)
+                background=_C.blue_1
             ),
             
             rx.box(
                 rx.vstack(
                     rx.hstack(
-                        rx.icon("cpu", size=32, color=rx.color("amber", 9)),
+                        rx.icon("cpu", size=32, color=_C.amber_9),
                         rx.heading("2. Traditional ML", size="5", weight="bold"),
                         spacing="2",
                         align="center"
@@ -293,15 +920,15 @@ def modeling_philosophy() -> rx.Component:
                 ),
                 padding="1.5em",
                 border="1px solid",
-                border_color=rx.color("amber", 5),
+                border_color=_C.amber_5,
                 border_radius="var(--radius-4)",
-                background=rx.color("amber", 1)
+                background=_C.amber_1
             ),
             
             rx.box(
                 rx.vstack(
                     rx.hstack(
-                        rx.icon("zap", size=32, color=rx.color("purple", 9)),
+                        rx.icon("zap", size=32, color=_C.purple_9),
                         rx.heading("3. Deep Learning", size="5", weight="bold"),
                         spacing="2",
                         align="center"
@@ -322,49 +949,26 @@ def modeling_philosophy() -> rx.Component:
                 ),
                 padding="1.5em",
                 border="1px solid",
-                border_color=rx.color("purple", 5),
+                border_color=_C.purple_5,
                 border_radius="var(--radius-4)",
-                background=rx.color("purple", 1)
-            ),
-            
-            columns="3",
-            spacing="3",
-            width="100%"
+                background=_C.purple_1
+            )
         ),
         
         rx.box(
             rx.vstack(
                 rx.hstack(
-                    rx.icon("chart-column-stacked", size=32, color=rx.color("green", 9)),
+                    rx.icon("chart-column-stacked", size=32, color=_C.green_9),
                     rx.heading("Evaluation Criteria", size="5", weight="bold", margin_bottom="0.5em")
                     ),
-                rx.grid(
-                    rx.vstack(
-                        rx.text.strong("R² (Coefficient of Determination)"),
-                        rx.text("How much of the gold price's movement can our model explain? (Scale: 0 to 1. Higher is better).", size="2", color="var(--gray-12)"),
-                        align="start"
-                    ),
-                    rx.vstack(
-                        rx.text.strong("RMSE (Root Mean Squared Error)"),
-                        rx.text("Average prediction error in dollars. Lower is better.", size="2", color="var(--gray-12)"),
-                        align="start"
-                    ),
-                    rx.vstack(
-                        rx.text.strong("MAE (Mean Absolute Error)"),
-                        rx.text("What is our average error, in dollars? (e.g., 'On average, the model is off by $35').", size="2", color="var(--gray-12)"),
-                        align="start"
-                    ),
-                    columns="3",
-                    spacing="3",
-                    width="100%"
-                ),
+                _grid3(*[_term_item(*term) for term in _EVAL_CRITERIA]),
                 spacing="2",
                 align="start"
             ),
             padding="1.5em",
-            background=rx.color("gray", 1),
+            background=_C.gray_1,
             border="1px solid",
-            border_color=rx.color("gray", 5),
+            border_color=_C.gray_5,
             border_radius="var(--radius-3)",
             margin_top="1.5em"
         ),
@@ -376,23 +980,9 @@ def modeling_philosophy() -> rx.Component:
     )
 
 
+@cache
 def simple_regression_detail() -> rx.Component:
     """Detailed simple regression results."""
-    simple_results = [
-        ["CPI", "0.720", "$266.74", "$210.61", "Strongest single predictor"],
-        ["S&P_500", "0.619", "$311.12", "$240.87", "Stock market correlation"],
-        ["Silver_Futures", "0.526", "$346.97", "$274.55", "Precious metal co-movement"],
-        ["USD_Index", "0.361", "$402.80", "$326.55", "Currency strength impact"],
-        ["GPR", "0.193", "$452.57", "$368.78", "Geopolitical risk factor"],
-        ["GPRA", "0.083", "$482.24", "$382.14", "Action-based risk"],
-        ["Real_Interest_Rate", "0.079", "$483.29", "$352.45", "Moderate predictive power"],
-        ["Treasury_Yield_10Y", "0.053", "$490.13", "$374.42", "Weak linear relationship"],
-        ["VIX", "-0.020", "$508.61", "$403.34", "Near-zero linear fit"],
-        ["Unemployment", "-0.002", "$504.21", "$400.82", "Near-zero linear fit"],
-        ["Crude_Oil", "0.001", "$503.37", "$391.79", "Near-zero linear fit"],
-        ["Fed_Funds_Rate", "-0.043", "$514.37", "$400.19", "Weak negative fit"]
-    ]
-    
     return rx.vstack(
         rx.heading("Simple Linear Regression: Testing Each Feature", size="6", weight="bold", margin_bottom="1em"),
         
@@ -435,20 +1025,17 @@ def simple_regression_detail() -> rx.Component:
                             *[
                                 rx.table.row(
                                     rx.table.cell(row[0]),
-                                    rx.table.cell(rx.badge(
-                                        row[1], 
-                                        color_scheme="green" if float(row[1].replace("−", "-")) > 0.5 else ("blue" if float(row[1].replace("−", "-")) > 0 else "red"), 
-                                        size="2"
+                                    rx.table.cell(_badge(
+                                        row[1],
+                                        "green" if (r2 := float(row[1])) > 0.5 else ("blue" if r2 > 0 else "red"),
+                                        "2"
                                     )),
                                     rx.table.cell(row[2]),
                                     rx.table.cell(row[3]),
                                     rx.table.cell(row[4]),
-                                    style={
-                                        "background": rx.color("green", 2) if i < 3 else "transparent",
-                                        "font_weight": "bold" if i < 3 else "normal"
-                                    }
+                                    style=_HIGHLIGHT_STYLE if i < 3 else {}
                                 )
-                                for i, row in enumerate(simple_results)
+                                for i, row in enumerate(_SIMPLE_ROWS)
                             ]
                         ),
                         variant="surface",
@@ -468,34 +1055,28 @@ def simple_regression_detail() -> rx.Component:
                 rx.box(
                     rx.vstack(
                         rx.heading("Top 9 Features Performance", size="5", weight="bold", margin_bottom="1em"),
-                        rx.image(
-                            src="/modeling_plots/univariate/top_9_polynomial.png",
-                            width="100%",
-                            border_radius="var(--radius-3)",
-                            border="1px solid",
-                            border_color=rx.color("gray", 5)
-                        ),
+                        _plot_image("/modeling_plots/univariate/top_9_polynomial.png"),
                         spacing="2",
                         align="start"
                     ),
                     padding="1.5em",
-                    background=rx.color("gray", 1),
+                    background=_C.gray_1,
                     border="1px solid",
-                    border_color=rx.color("gray", 5),
+                    border_color=_C.gray_5,
                     border_radius="var(--radius-4)",
                     margin_bottom="1.5em"
                 ),
                 rx.vstack(
-                    rx.grid(
+                    _grid3(
                         rx.box(
                             rx.vstack(
                                 rx.hstack(
-                                    rx.icon("trophy", size=24, color=rx.color("amber", 9)),
+                                    rx.icon("trophy", size=24, color=_C.amber_9),
                                     rx.heading("1. CPI (Inflation)", size="4", weight="bold"),
                                     spacing="2",
                                     align="center"
                                 ),
-                                rx.heading("R² = 0.720", size="6", weight="bold", color=rx.color("green", 10)),
+                                rx.heading("R² = 0.720", size="6", weight="bold", color=_C.green_10),
                                 rx.text("RMSE: $266.74 | MAE: $210.61", size="3", color="var(--gray-11)"),
                                 rx.divider(margin_y="0.75em"),
                                 rx.text(
@@ -509,27 +1090,27 @@ def simple_regression_detail() -> rx.Component:
                                 rx.text.strong(
                                     "Formula: Gold = 13.41 x CPI - 1876.60",
                                     size="2",
-                                    color=rx.color("amber", 10)
+                                    color=_C.amber_10
                                 ),
                                 spacing="2",
                                 align="start"
                             ),
                             padding="1.5em",
-                            background=rx.color("amber", 1),
+                            background=_C.amber_1,
                             border="2px solid",
-                            border_color=rx.color("amber", 6),
+                            border_color=_C.amber_6,
                             border_radius="var(--radius-4)"
                         ),
                         
                         rx.box(
                             rx.vstack(
                                 rx.hstack(
-                                    rx.icon("trending-up", size=24, color=rx.color("blue", 9)),
+                                    rx.icon("trending-up", size=24, color=_C.blue_9),
                                     rx.heading("2. S&P 500", size="4", weight="bold"),
                                     spacing="2",
                                     align="center"
                                 ),
-                                rx.heading("R² = 0.619", size="6", weight="bold", color=rx.color("green", 10)),
+                                rx.heading("R² = 0.619", size="6", weight="bold", color=_C.green_10),
                                 rx.text("RMSE: $311.12 | MAE: $240.87", size="3", color="var(--gray-11)"),
                                 rx.divider(margin_y="0.75em"),
                                 rx.text(
@@ -543,27 +1124,27 @@ def simple_regression_detail() -> rx.Component:
                                 rx.text.strong(
                                     "Formula: Gold = 0.30 x S&P500 + 686.66",
                                     size="2",
-                                    color=rx.color("blue", 10)
+                                    color=_C.blue_10
                                 ),
                                 spacing="2",
                                 align="start"
                             ),
                             padding="1.5em",
-                            background=rx.color("blue", 1),
+                            background=_C.blue_1,
                             border="2px solid",
-                            border_color=rx.color("blue", 6),
+                            border_color=_C.blue_6,
                             border_radius="var(--radius-4)"
                         ),
                         
                         rx.box(
                             rx.vstack(
                                 rx.hstack(
-                                    rx.icon("gem", size=24, color=rx.color("purple", 9)),
+                                    rx.icon("gem", size=24, color=_C.purple_9),
                                     rx.heading("3. Silver Futures", size="4", weight="bold"),
                                     spacing="2",
                                     align="center"
                                 ),
-                                rx.heading("R² = 0.526", size="6", weight="bold", color=rx.color("green", 10)),
+                                rx.heading("R² = 0.526", size="6", weight="bold", color=_C.green_10),
                                 rx.text("RMSE: $346.97 | MAE: $274.55", size="3", color="var(--gray-11)"),
                                 rx.divider(margin_y="0.75em"),
                                 rx.text(
@@ -577,21 +1158,17 @@ def simple_regression_detail() -> rx.Component:
                                 rx.text.strong(
                                     "Formula: Gold = 50.17 x Silver + 382.50",
                                     size="2",
-                                    color=rx.color("purple", 10)
+                                    color=_C.purple_10
                                 ),
                                 spacing="2",
                                 align="start"
                             ),
                             padding="1.5em",
-                            background=rx.color("purple", 1),
+                            background=_C.purple_1,
                             border="2px solid",
-                            border_color=rx.color("purple", 6),
+                            border_color=_C.purple_6,
                             border_radius="var(--radius-4)"
-                        ),
-                        
-                        columns="3",
-                        spacing="3",
-                        width="100%"
+                        )
                     ),
                     
                     spacing="3",
@@ -617,81 +1194,77 @@ def simple_regression_detail() -> rx.Component:
                             ),
                             
                             # Weak/Failed features (6 features)
-                            rx.heading("Weak/Insignificant (R² < 0.08)", size="4", weight="bold", margin_bottom="0.75em", color=rx.color("red", 10)),
-                            rx.grid(
+                            rx.heading("Weak/Insignificant (R² < 0.08)", size="4", weight="bold", margin_bottom="0.75em", color=_C.red_10),
+                            _grid2(
                                 rx.vstack(
-                                    rx.text.strong("VIX (R² = -0.020)", color=rx.color("red", 10)),
+                                    rx.text.strong("VIX (R² = -0.020)", color=_C.red_10),
                                     rx.text("High p-value (>> 0.05). Affects gold through time lags/threshold effects.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("Crude Oil (R² = 0.001)", color=rx.color("red", 10)),
+                                    rx.text.strong("Crude Oil (R² = 0.001)", color=_C.red_10),
                                     rx.text("Supply shocks create noise. Works better in Multiple context.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("Unemployment (R² = -0.002)", color=rx.color("red", 10)),
+                                    rx.text.strong("Unemployment (R² = -0.002)", color=_C.red_10),
                                     rx.text("Indirect effect through Fed policy. Non-linear relationship.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("Fed Funds (R² = -0.043)", color=rx.color("red", 10)),
+                                    rx.text.strong("Fed Funds (R² = -0.043)", color=_C.red_10),
                                     rx.text("Multiple channels with lags. Needs Multiple context.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("Treasury Yield (R² = 0.053)", color=rx.color("red", 10)),
+                                    rx.text.strong("Treasury Yield (R² = 0.053)", color=_C.red_10),
                                     rx.text("Regime-dependent. Flight-to-quality vs inflation effects.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("Real Interest (R² = 0.079)", color=rx.color("red", 10)),
+                                    rx.text.strong("Real Interest (R² = 0.079)", color=_C.red_10),
                                     rx.text("7.9% power. Regime changes (QE vs rate hikes) complicate linear fit.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
-                                columns="2",
                                 spacing="2",
-                                width="100%",
                                 margin_bottom="1.5em"
                             ),
                             
                             # Moderate predictors (3 features)
-                            rx.heading("Moderate Predictors (R² = 0.08–0.36)", size="4", weight="bold", margin_bottom="0.75em", color=rx.color("blue", 10)),
-                            rx.grid(
+                            rx.heading("Moderate Predictors (R² = 0.08–0.36)", size="4", weight="bold", margin_bottom="0.75em", color=_C.blue_10),
+                            _grid3(
                                 rx.vstack(
-                                    rx.text.strong("USD Index (R² = 0.361)", color=rx.color("blue", 10)),
+                                    rx.text.strong("USD Index (R² = 0.361)", color=_C.blue_10),
                                     rx.text("36% power, significant p-value. Inverse USD-gold relationship, but regime-dependent.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("GPR (R² = 0.193)", color=rx.color("blue", 10)),
+                                    rx.text.strong("GPR (R² = 0.193)", color=_C.blue_10),
                                     rx.text("19% power. Safe-haven response to geopolitical events (episodic, not continuous).", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
                                 rx.vstack(
-                                    rx.text.strong("GPRA (R² = 0.083)", color=rx.color("blue", 10)),
+                                    rx.text.strong("GPRA (R² = 0.083)", color=_C.blue_10),
                                     rx.text("8% power. Action-based risk component, event-driven spikes.", size="2", color="var(--gray-12)"),
                                     align="start", spacing="1"
                                 ),
-                                columns="3",
-                                spacing="2",
-                                width="100%"
+                                spacing="2"
                             ),
                             
                             spacing="3",
                             align="start"
                         ),
                         padding="1.5em",
-                        background=rx.color("gray", 1),
+                        background=_C.gray_1,
                         border="1px solid",
-                        border_color=rx.color("gray", 5),
+                        border_color=_C.gray_5,
                         border_radius="var(--radius-4)"
                     ),
                     
                     rx.box(
                         rx.vstack(
                             rx.hstack(
-                                rx.icon("lightbulb", size=24, color=rx.color("amber", 9)),
+                                rx.icon("lightbulb", size=24, color=_C.amber_9),
                                 rx.heading("Solution: Multiple Models", size="4", weight="bold"),
                                 spacing="2",
                                 align="center",
@@ -709,8 +1282,8 @@ def simple_regression_detail() -> rx.Component:
                             align="start"
                         ),
                         padding="1.25em",
-                        background=rx.color("amber", 2),
-                        border_left=f"4px solid {rx.color('amber', 9)}",
+                        background=_C.amber_2,
+                        border_left=_BORDERS["amber", 9, 4],
                         border_radius="var(--radius-3)",
                         margin_top="1em"
                     ),
@@ -733,543 +1306,192 @@ def simple_regression_detail() -> rx.Component:
     )
 
 
-def Multiple_regression_detail() -> rx.Component:
-    """OLS regression with statistical details."""
+# Static sections take no inputs, so each tree is built once per process.
+@cache
+def _multiple_coef_tab() -> rx.Component:
+    """Coefficients tab of the Multiple regression section."""
     return rx.vstack(
-        rx.heading("Multiple Linear Regression: Combining All Features", size="6", weight="bold", margin_bottom="1em"),
-        
         rx.text(
-            "Now we use all 13 features simultaneously. This allows the model to capture interactions between variables "
-            "(e.g., inflation and interest rates together affecting gold). Results: ",
-            rx.text.strong("R² = 0.947"), ", ",
-            rx.text.strong("RMSE = $115.88"), ", ",
-            rx.text.strong("MAE = $77.06"), ".",
-            size="4",
+            "OLS (Ordinary Least Squares) regression output showing coefficient estimates, standard errors, and statistical significance (p-values). "
+            "Features with p < 0.05 are statistically significant.",
+            size="3",
             color="var(--gray-12)",
-            line_height="1.7",
-            margin_bottom="1.5em"
+            margin_bottom="1em",
+            line_height="1.6"
+        ),
+        
+        rx.table.root(
+            rx.table.header(
+                rx.table.row(
+                    rx.table.column_header_cell("Feature"),
+                    rx.table.column_header_cell("Coefficient (β)"),
+                    rx.table.column_header_cell("p-value"),
+                    rx.table.column_header_cell("95% CI"),
+                    rx.table.column_header_cell("Significance"),
+                )
+            ),
+            rx.table.body(*[_coef_row(*row) for row in _COEF_ROWS]),
+            variant="surface",
+            size="3",
+            width="100%"
         ),
         
+        rx.box(
+            rx.vstack(
+                rx.heading("Key Findings", size="4", weight="bold", margin_bottom="0.5em"),
+                _md_list(_KEY_FINDINGS_MD),
+                spacing="2",
+                align="start"
+            ),
+            padding="1.25em",
+            background=_C.blue_1,
+            border_left=_BORDERS["blue", 9, 4],
+            border_radius="var(--radius-3)",
+            margin_top="1em"
+        ),
+        
+        spacing="3",
+        align="start",
+        width="100%"
+    )
+
+
+@cache
+def _multiple_diag_tab() -> rx.Component:
+    """Model diagnostics tab of the Multiple regression section."""
+    return rx.vstack(
+        rx.heading("Model Diagnostics & Assumptions", size="5", weight="bold", margin_bottom="1em"),
         rx.grid(
-            metric_card("R²", "0.947", "green", "95% variance explained"),
-            metric_card("RMSE", "$115.88", "purple", "Typical error"),
-            metric_card("MAE", "$77.06", "amber", "Average deviation"),
-            columns="4",
+            *[_diag_card(*card) for card in _DIAG_CARDS],
+            columns="2",
             spacing="3",
-            width="100%",
-            margin_y="1em"
+            width="100%"
         ),
         
-        rx.tabs.root(
-            rx.tabs.list(
-                rx.tabs.trigger("Coefficients & Significance", value="coef"),
-                rx.tabs.trigger("Model Diagnostics", value="diag"),
-                rx.tabs.trigger("VIF Analysis", value="vif"),
+        rx.box(
+            rx.vstack(
+                rx.heading("Interpretation", size="4", weight="bold", margin_bottom="0.5em"),
+                _md_list(_DIAG_INTERPRETATION_MD),
+                spacing="2",
+                align="start"
             ),
-            
-            rx.tabs.content(
-                rx.vstack(
-                    rx.text(
-                        "OLS (Ordinary Least Squares) regression output showing coefficient estimates, standard errors, and statistical significance (p-values). "
-                        "Features with p < 0.05 are statistically significant.",
-                        size="3",
-                        color="var(--gray-12)",
-                        margin_bottom="1em",
-                        line_height="1.6"
-                    ),
-                    
-                    rx.table.root(
-                        rx.table.header(
-                            rx.table.row(
-                                rx.table.column_header_cell("Feature"),
-                                rx.table.column_header_cell("Coefficient (β)"),
-                                rx.table.column_header_cell("p-value"),
-                                rx.table.column_header_cell("95% CI"),
-                                rx.table.column_header_cell("Significance"),
-                            )
-                        ),
-                        rx.table.body(
-                            rx.table.row(
-                                rx.table.cell("Intercept"),
-                                rx.table.cell("-1009.58"),
-                                rx.table.cell(rx.badge("0.000", color_scheme="green", size="2")),
-                                rx.table.cell("[-1554, -465]"),
-                                rx.table.cell("Highly significant"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("Silver_Futures")),
-                                rx.table.cell(rx.text.strong("+25.49")),
-                                rx.table.cell(rx.badge("0.000", color_scheme="green", size="2")),
-                                rx.table.cell("[21.35, 29.64]"),
-                                rx.table.cell("Very strong"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("Unemployment")),
-                                rx.table.cell(rx.text.strong("+32.04")),
-                                rx.table.cell(rx.badge("0.000", color_scheme="green", size="2")),
-                                rx.table.cell("[19.63, 44.45]"),
-                                rx.table.cell("Positive"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("CPI")),
-                                rx.table.cell(rx.text.strong("+10.20")),
-                                rx.table.cell(rx.badge("0.000", color_scheme="green", size="2")),
-                                rx.table.cell("[7.46, 12.95]"),
-                                rx.table.cell("Inflation hedge"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("S&P_500")),
-                                rx.table.cell(rx.text.strong("+0.103")),
-                                rx.table.cell(rx.badge("0.000", color_scheme="green", size="2")),
-                                rx.table.cell("[0.050, 0.156]"),
-                                rx.table.cell("Market linkage"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("USD_Index")),
-                                rx.table.cell(rx.text.strong("-7.84")),
-                                rx.table.cell(rx.badge("0.010", color_scheme="green", size="2")),
-                                rx.table.cell("[-13.76, -1.91]"),
-                                rx.table.cell("Currency inverse"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell(rx.text.strong("Crude_Oil")),
-                                rx.table.cell(rx.text.strong("-2.20")),
-                                rx.table.cell(rx.badge("0.022", color_scheme="green", size="2")),
-                                rx.table.cell("[-4.08, -0.33]"),
-                                rx.table.cell("Negative (multicollinearity)"),
-                                style={"background": rx.color("green", 2), "font_weight": "bold"}
-                            ),
-                            rx.table.row(
-                                rx.table.cell("VIX"),
-                                rx.table.cell("+1.51"),
-                                rx.table.cell(rx.badge("0.239", color_scheme="gray", size="2")),
-                                rx.table.cell("[-1.01, 4.02]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Treasury_Yield_10Y"),
-                                rx.table.cell("-52.38"),
-                                rx.table.cell(rx.badge("0.171", color_scheme="gray", size="2")),
-                                rx.table.cell("[-127.63, 22.87]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Real_Interest_Rate"),
-                                rx.table.cell("+24.05"),
-                                rx.table.cell(rx.badge("0.525", color_scheme="gray", size="2")),
-                                rx.table.cell("[-50.55, 98.66]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Fed_Funds_Rate"),
-                                rx.table.cell("+5.12"),
-                                rx.table.cell(rx.badge("0.609", color_scheme="gray", size="2")),
-                                rx.table.cell("[-14.62, 24.87]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("GPR"),
-                                rx.table.cell("+0.22"),
-                                rx.table.cell(rx.badge("0.682", color_scheme="gray", size="2")),
-                                rx.table.cell("[-0.86, 1.31]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("GPRA"),
-                                rx.table.cell("+0.08"),
-                                rx.table.cell(rx.badge("0.867", color_scheme="gray", size="2")),
-                                rx.table.cell("[-0.84, 0.99]"),
-                                rx.table.cell("Not significant"),
-                            ),
-                        ),
-                        variant="surface",
-                        size="3",
-                        width="100%"
-                    ),
-                    
-                    rx.box(
-                        rx.vstack(
-                            rx.heading("Key Findings", size="4", weight="bold", margin_bottom="0.5em"),
-                            rx.unordered_list(
-                                rx.list_item(
-                                    rx.text.strong("6 significant features (p < 0.05): "),
-                                    "Silver, Unemployment, CPI, S&P500, USD Index, Crude Oil"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Unemployment coefficient (+32.04): "),
-                                    "When unemployment increase -> gold increase (safe haven during economic stress)"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Crude Oil negative (-2.20): "),
-                                    "Counterintuitive, likely due to multicollinearity with CPI"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("7 non-significant features: "),
-                                    "VIX, interest rates, geopolitical indices (redundant in Multiple context)"
-                                ),
-                                spacing="2",
-                                padding_left="1.5em"
-                            ),
-                            spacing="2",
-                            align="start"
-                        ),
-                        padding="1.25em",
-                        background=rx.color("blue", 1),
-                        border_left=f"4px solid {rx.color('blue', 9)}",
-                        border_radius="var(--radius-3)",
-                        margin_top="1em"
-                    ),
-                    
-                    spacing="3",
-                    align="start",
-                    width="100%"
+            padding="1.25em",
+            background=_C.gray_1,
+            border="1px solid",
+            border_color=_C.gray_5,
+            border_radius="var(--radius-3)",
+            margin_top="1em"
+        ),
+
+        # Diagnostic Plots Visualization
+        rx.box(
+            rx.vstack(
+                rx.heading("Diagnostic Plots (3-Panel)", size="5", weight="bold", margin_bottom="1em"),
+                _plot_image("/modeling_plots/multivariate/diagnostics_3panel.png"),
+                rx.text(
+                    "(a) Predicted vs Actual shows strong linear fit with R²=0.947. "
+                    "(b) Residuals vs Predicted reveals some heteroscedasticity (wider spread at extremes). "
+                    "(c) Residual Distribution shows positive skew and heavy tails (non-normal).",
+                    size="2",
+                    color="var(--gray-11)",
+                    line_height="1.6",
+                    margin_top="0.5em"
                 ),
+                spacing="2",
+                align="start"
+            ),
+            padding="1.5em",
+            background=_C.blue_1,
+            border="1px solid",
+            border_color=_C.blue_5,
+            border_radius="var(--radius-4)",
+            margin_top="1.5em"
+        ),
+        
+        spacing="3",
+        align="start",
+        width="100%"
+    )
+
+
+@cache
+def _multiple_vif_tab() -> rx.Component:
+    """VIF tab of the Multiple regression section."""
+    return rx.vstack(
+        rx.heading("Variance Inflation Factor (VIF) Analysis", size="5", weight="bold", margin_bottom="1em"),
+        
+        rx.text(
+            "VIF quantifies how much a feature's variance is inflated due to multicollinearity. "
+            "Rule of thumb: VIF > 10 indicates high multicollinearity requiring attention.",
+            size="3",
+            color="var(--gray-12)",
+            margin_bottom="1em",
+            line_height="1.6"
+        ),
+        
+        rx.table.root(
+            rx.table.header(
+                rx.table.row(
+                    rx.table.column_header_cell("Feature"),
+                    rx.table.column_header_cell("VIF"),
+                    rx.table.column_header_cell("Status"),
+                    rx.table.column_header_cell("Interpretation"),
+                )
+            ),
+            rx.table.body(*[_vif_row(*row) for row in _VIF_ROWS]),
+            variant="surface",
+            size="3",
+            width="100%"
+        ),
+        
+        rx.box(
+            rx.vstack(
+                rx.heading("Multicollinearity Assessment", size="4", weight="bold", margin_bottom="0.5em"),
+                _md_list(_VIF_ASSESSMENT_MD),
+                spacing="2",
+                align="start"
+            ),
+            padding="1.25em",
+            background=_C.purple_1,
+            border_left=_BORDERS["purple", 9, 4],
+            border_radius="var(--radius-3)",
+            margin_top="1em"
+        ),
+        
+        spacing="3",
+        align="start",
+        width="100%"
+    )
+
+
+@cache
+def Multiple_regression_detail() -> rx.Component:
+    """OLS regression with statistical details."""
+    return rx.vstack(
+        rx.heading("Multiple Linear Regression: Combining All Features", size="6", weight="bold", margin_bottom="1em"),
+        
+        _MULTIPLE_HEADER,
+        _MULTIPLE_METRICS,
+        
+        rx.tabs.root(
+            rx.tabs.list(
+                rx.tabs.trigger("Coefficients & Significance", value="coef"),
+                rx.tabs.trigger("Model Diagnostics", value="diag"),
+                rx.tabs.trigger("VIF Analysis", value="vif"),
+            ),
+            
+            rx.tabs.content(
+                _multiple_coef_tab(),
                 value="coef"
             ),
             
             rx.tabs.content(
-                rx.vstack(
-                    rx.heading("Model Diagnostics & Assumptions", size="5", weight="bold", margin_bottom="1em"),
-                    rx.grid(
-                        rx.box(
-                            rx.vstack(
-                                rx.text.strong("Overall Model Fit"),
-                                rx.divider(margin_y="0.5em"),
-                                rx.hstack(
-                                    rx.text("F-statistic:", size="2", color="var(--gray-11)"),
-                                    rx.heading("312.9", size="5", color=rx.color("green", 10)),
-                                    spacing="2",
-                                    align="center"
-                                ),
-                                rx.text("Prob (F) = 1.89e-110 ~ 0.000", size="2", color="var(--gray-12)"),
-                                rx.text("Model is highly significant", size="2", color=rx.color("green", 10), weight="bold"),
-                                spacing="2",
-                                align="start"
-                            ),
-                            padding="1.25em",
-                            background=rx.color("green", 1),
-                            border="1px solid",
-                            border_color=rx.color("green", 5),
-                            border_radius="var(--radius-3)"
-                        ),
-                        
-                        rx.box(
-                            rx.vstack(
-                                rx.text.strong("Durbin-Watson"),
-                                rx.divider(margin_y="0.5em"),
-                                rx.hstack(
-                                    rx.text("DW statistic:", size="2", color="var(--gray-11)"),
-                                    rx.heading("2.221", size="5", color=rx.color("blue", 10)),
-                                    spacing="2",
-                                    align="center"
-                                ),
-                                rx.text("Target: near 2.0", size="2", color="var(--gray-12)"),
-                                rx.text("No autocorrelation", size="2", color=rx.color("green", 10), weight="bold"),
-                                spacing="2",
-                                align="start"
-                            ),
-                            padding="1.25em",
-                            background=rx.color("blue", 1),
-                            border="1px solid",
-                            border_color=rx.color("blue", 5),
-                            border_radius="var(--radius-3)"
-                        ),
-                        
-                        rx.box(
-                            rx.vstack(
-                                rx.text.strong("Omnibus Test"),
-                                rx.divider(margin_y="0.5em"),
-                                rx.hstack(
-                                    rx.text("Prob:", size="2", color="var(--gray-11)"),
-                                    rx.heading("0.000", size="5", color=rx.color("red", 10)),
-                                    spacing="2",
-                                    align="center"
-                                ),
-                                rx.text("Skew: 0.928 | Kurtosis: 10.38", size="2", color="var(--gray-12)"),
-                                rx.text("Residuals not normal", size="2", color=rx.color("red", 10), weight="bold"),
-                                spacing="2",
-                                align="start"
-                            ),
-                            padding="1.25em",
-                            background=rx.color("red", 1),
-                            border="1px solid",
-                            border_color=rx.color("red", 5),
-                            border_radius="var(--radius-3)"
-                        ),
-                        
-                        rx.box(
-                            rx.vstack(
-                                rx.text.strong("Condition Number"),
-                                rx.divider(margin_y="0.5em"),
-                                rx.hstack(
-                                    rx.text("Cond No.:", size="2", color="var(--gray-11)"),
-                                    rx.heading("9.90e+04", size="5", color=rx.color("orange", 10)),
-                                    spacing="2",
-                                    align="center"
-                                ),
-                                rx.text("Threshold: > 30 indicates multicollinearity", size="2", color="var(--gray-12)"),
-                                rx.text("Moderate multicollinearity", size="2", color=rx.color("orange", 10), weight="bold"),
-                                spacing="2",
-                                align="start"
-                            ),
-                            padding="1.25em",
-                            background=rx.color("orange", 1),
-                            border="1px solid",
-                            border_color=rx.color("orange", 5),
-                            border_radius="var(--radius-3)"
-                        ),
-                        
-                        columns="2",
-                        spacing="3",
-                        width="100%"
-                    ),
-                    
-                    rx.box(
-                        rx.vstack(
-                            rx.heading("Interpretation", size="4", weight="bold", margin_bottom="0.5em"),
-                            rx.unordered_list(
-                                rx.list_item(
-                                    rx.text.strong("Strong overall fit: "),
-                                    "F-statistic = ",
-                                    rx.text.strong("312.9"),
-                                    " confirms the model explains variance ",
-                                    rx.text.strong("significantly better than the null model")
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("No autocorrelation: "),
-                                    "Durbin-Watson = ",
-                                    rx.text.strong("2.221 ~ 2.0"),
-                                    " means ",
-                                    rx.text.strong("residuals are independent"),
-                                    " (good for regression assumptions)"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Non-normal residuals: "),
-                                    "Skew = ",
-                                    rx.text.strong("0.928"),
-                                    ", Kurtosis = ",
-                                    rx.text.strong("10.38"),
-                                    " indicate ",
-                                    rx.text.strong("heavy-tailed distribution"),
-                                    ". This affects t-test/F-test reliability."
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Multicollinearity present: "),
-                                    "Condition number = ",
-                                    rx.text.strong("99,000"),
-                                    " suggests some features are highly correlated (e.g., CPI <-> M2, S&P <-> NASDAQ removed earlier)"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Solution: "),
-                                    "Use Ridge regression or remove non-significant features to reduce multicollinearity"
-                                ),
-                                spacing="2",
-                                padding_left="1.5em"
-                            ),
-                            spacing="2",
-                            align="start"
-                        ),
-                        padding="1.25em",
-                        background=rx.color("gray", 1),
-                        border="1px solid",
-                        border_color=rx.color("gray", 5),
-                        border_radius="var(--radius-3)",
-                        margin_top="1em"
-                    ),
-
-                    # Diagnostic Plots Visualization
-                    rx.box(
-                        rx.vstack(
-                            rx.heading("Diagnostic Plots (3-Panel)", size="5", weight="bold", margin_bottom="1em"),
-                            rx.image(
-                                src="/modeling_plots/multivariate/diagnostics_3panel.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "(a) Predicted vs Actual shows strong linear fit with R²=0.947. "
-                                "(b) Residuals vs Predicted reveals some heteroscedasticity (wider spread at extremes). "
-                                "(c) Residual Distribution shows positive skew and heavy tails (non-normal).",
-                                size="2",
-                                color="var(--gray-11)",
-                                line_height="1.6",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            align="start"
-                        ),
-                        padding="1.5em",
-                        background=rx.color("blue", 1),
-                        border="1px solid",
-                        border_color=rx.color("blue", 5),
-                        border_radius="var(--radius-4)",
-                        margin_top="1.5em"
-                    ),
-                    
-                    spacing="3",
-                    align="start",
-                    width="100%"
-                ),
+                _multiple_diag_tab(),
                 value="diag"
             ),
             
             rx.tabs.content(
-                rx.vstack(
-                    rx.heading("Variance Inflation Factor (VIF) Analysis", size="5", weight="bold", margin_bottom="1em"),
-                    
-                    rx.text(
-                        "VIF quantifies how much a feature's variance is inflated due to multicollinearity. "
-                        "Rule of thumb: VIF > 10 indicates high multicollinearity requiring attention.",
-                        size="3",
-                        color="var(--gray-12)",
-                        margin_bottom="1em",
-                        line_height="1.6"
-                    ),
-                    
-                    rx.table.root(
-                        rx.table.header(
-                            rx.table.row(
-                                rx.table.column_header_cell("Feature"),
-                                rx.table.column_header_cell("VIF"),
-                                rx.table.column_header_cell("Status"),
-                                rx.table.column_header_cell("Interpretation"),
-                            )
-                        ),
-                        rx.table.body(
-                            rx.table.row(
-                                rx.table.cell("CPI"),
-                                rx.table.cell(rx.heading("1805.21", size="4", color=rx.color("red", 10))),
-                                rx.table.cell(rx.badge("Severe", color_scheme="red", size="2")),
-                                rx.table.cell("Extremely high correlation with other macro variables"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("USD_Index"),
-                                rx.table.cell(rx.heading("1012.78", size="4", color=rx.color("red", 10))),
-                                rx.table.cell(rx.badge("Severe", color_scheme="red", size="2")),
-                                rx.table.cell("Strong correlation with interest rates and inflation"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Treasury_Yield_10Y"),
-                                rx.table.cell(rx.heading("179.92", size="4", color=rx.color("red", 10))),
-                                rx.table.cell(rx.badge("Severe", color_scheme="red", size="2")),
-                                rx.table.cell("Tied to Fed policy and real interest rates"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Crude_Oil"),
-                                rx.table.cell(rx.heading("76.45", size="4", color=rx.color("red", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="red", size="2")),
-                                rx.table.cell("Energy component highly correlated with CPI"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("GPR"),
-                                rx.table.cell(rx.heading("50.16", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="orange", size="2")),
-                                rx.table.cell("Geopolitical risk overlaps with market uncertainty"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("S&P_500"),
-                                rx.table.cell(rx.heading("48.05", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="orange", size="2")),
-                                rx.table.cell("Stock index correlated with macro conditions"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Silver_Futures"),
-                                rx.table.cell(rx.heading("33.21", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="orange", size="2")),
-                                rx.table.cell("Precious metals co-movement"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("GPRA"),
-                                rx.table.cell(rx.heading("32.72", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="orange", size="2")),
-                                rx.table.cell("Action-based risk correlates with GPR"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Real_Interest_Rate"),
-                                rx.table.cell(rx.heading("30.81", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("High", color_scheme="orange", size="2")),
-                                rx.table.cell("Derived from Fed rate and inflation"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Unemployment"),
-                                rx.table.cell(rx.heading("23.61", size="4", color=rx.color("orange", 10))),
-                                rx.table.cell(rx.badge("Moderate", color_scheme="orange", size="2")),
-                                rx.table.cell("Labor market reflects macro conditions"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("VIX"),
-                                rx.table.cell(rx.heading("11.45", size="4", color=rx.color("blue", 10))),
-                                rx.table.cell(rx.badge("Moderate", color_scheme="blue", size="2")),
-                                rx.table.cell("Volatility index, some overlap with risk measures"),
-                            ),
-                            rx.table.row(
-                                rx.table.cell("Fed_Funds_Rate"),
-                                rx.table.cell("9.87"),
-                                rx.table.cell(rx.badge("Low", color_scheme="green", size="2")),
-                                rx.table.cell("Policy rate, relatively independent"),
-                            ),
-                        ),
-                        variant="surface",
-                        size="3",
-                        width="100%"
-                    ),
-                    
-                    rx.box(
-                        rx.vstack(
-                            rx.heading("Multicollinearity Assessment", size="4", weight="bold", margin_bottom="0.5em"),
-                            rx.unordered_list(
-                                rx.list_item(
-                                    rx.text.strong("Severe multicollinearity (VIF > 100): "),
-                                    "CPI (1805.21), USD Index (1012.78), and Treasury Yield (179.92) show extreme correlation with other macroeconomic variables"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("High multicollinearity (VIF 30-100): "),
-                                    "Crude Oil (76.45), GPR (50.16), S&P 500 (48.05), Silver Futures (33.21), GPRA (32.72), and Real Interest Rate (30.81)"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Moderate multicollinearity (VIF 10-30): "),
-                                    "Unemployment (23.61) and VIX (11.45) indicate some correlation with other features"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Low multicollinearity (VIF < 10): "),
-                                    "Only Fed Funds Rate (9.87) falls below the traditional threshold, suggesting relatively independent behavior"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Ridge regression test: "),
-                                    "Applied L2 regularization showed no improvement (",
-                                    rx.text.strong("R² = 0.947"),
-                                    " identical to OLS), indicating that while multicollinearity exists, it does not significantly degrade predictive performance"
-                                ),
-                                rx.list_item(
-                                    rx.text.strong("Modeling decision: "),
-                                    "Retained all features despite high VIF values. The multicollinearity reflects genuine economic relationships (e.g., inflation driving both CPI and USD strength). "
-                                    "Removing features would sacrifice valuable information without meaningful performance gains."
-                                ),
-                                spacing="2",
-                                padding_left="1.5em"
-                            ),
-                            spacing="2",
-                            align="start"
-                        ),
-                        padding="1.25em",
-                        background=rx.color("purple", 1),
-                        border_left=f"4px solid {rx.color('purple', 9)}",
-                        border_radius="var(--radius-3)",
-                        margin_top="1em"
-                    ),
-                    
-                    spacing="3",
-                    align="start",
-                    width="100%"
-                ),
+                _multiple_vif_tab(),
                 value="vif"
             ),
             
@@ -1281,9 +1503,10 @@ def Multiple_regression_detail() -> rx.Component:
         align="start",
         width="100%",
         margin_bottom="2em"
-    ),
+    )
 
 
+@cache
 def polynomial_regression_section() -> rx.Component:
     """Polynomial regression - brief section."""
     return rx.vstack(
@@ -1299,74 +1522,50 @@ def polynomial_regression_section() -> rx.Component:
         ),
         
         # Visualization: Linear vs Polynomial Comparison
-        rx.box(
-            rx.vstack(
-                rx.heading("Linear vs Polynomial Fit: Silver Futures", size="5", weight="bold", margin_bottom="1em"),
-                rx.image(
-                    src="/modeling_plots/polynomial/silver_compare_polynomial.png",
-                    width="100%",
-                    border_radius="var(--radius-3)",
-                    border="1px solid",
-                    border_color=rx.color("gray", 5)
-                ),
-                rx.text(
-                    "Comparing linear (degree 1) and polynomial (degree 2) fits for Silver Futures. "
-                    "The polynomial curve captures slight non-linearity but improves R² by only 1%.",
-                    size="2",
-                    color="var(--gray-11)",
-                    text_align="center",
-                    margin_top="0.5em"
-                ),
-                spacing="2",
-                align="start"
+        _card(
+            rx.heading("Linear vs Polynomial Fit: Silver Futures", size="5", weight="bold", margin_bottom="1em"),
+            _plot_image("/modeling_plots/polynomial/silver_compare_polynomial.png"),
+            rx.text(
+                "Comparing linear (degree 1) and polynomial (degree 2) fits for Silver Futures. "
+                "The polynomial curve captures slight non-linearity but improves R² by only 1%.",
+                size="2",
+                color="var(--gray-11)",
+                text_align="center",
+                margin_top="0.5em"
             ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-4)",
             margin_bottom="1.5em"
         ),
         
-        rx.box(
-            rx.vstack(
-                rx.heading("Best Result: Silver (R² = 0.537)", size="5", weight="bold", margin_bottom="0.75em", color=rx.color("green", 10)),
-                rx.text(
-                    "Polynomial regression on Silver Futures achieves ",
-                    rx.text.strong("R² = 0.537"),
-                    " versus linear ",
-                    rx.text.strong("R² = 0.526"),
-                    " - a marginal 1% improvement. "
-                    "CPI polynomial performs worse (",
-                    rx.text.strong("R² = 0.698"),
-                    " versus linear ",
-                    rx.text.strong("0.720"),
-                    "). Most features show no benefit from polynomial transformation.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7",
-                    margin_bottom="1em"
-                ),
-                rx.heading("Verdict: Curves Don't Help", size="5", weight="bold", margin_bottom="0.5em"),
-                rx.text(
-                    rx.text.strong("Gold-feature relationships are approximately linear"),
-                    ". Adding polynomial terms creates ",
-                    rx.text.strong("overfitting risk"),
-                    " without meaningful performance gain. ",
-                    rx.text.strong("Multiple linear models remain the better path"),
-                    ".",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
-                spacing="2",
-                align="start"
+        _card(
+            rx.heading("Best Result: Silver (R² = 0.537)", size="5", weight="bold", margin_bottom="0.75em", color=_C.green_10),
+            rx.text(
+                "Polynomial regression on Silver Futures achieves ",
+                rx.text.strong("R² = 0.537"),
+                " versus linear ",
+                rx.text.strong("R² = 0.526"),
+                " - a marginal 1% improvement. "
+                "CPI polynomial performs worse (",
+                rx.text.strong("R² = 0.698"),
+                " versus linear ",
+                rx.text.strong("0.720"),
+                "). Most features show no benefit from polynomial transformation.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7",
+                margin_bottom="1em"
             ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-4)"
+            rx.heading("Verdict: Curves Don't Help", size="5", weight="bold", margin_bottom="0.5em"),
+            rx.text(
+                rx.text.strong("Gold-feature relationships are approximately linear"),
+                ". Adding polynomial terms creates ",
+                rx.text.strong("overfitting risk"),
+                " without meaningful performance gain. ",
+                rx.text.strong("Multiple linear models remain the better path"),
+                ".",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7"
+            )
         ),
         
         spacing="3",
@@ -1376,31 +1575,9 @@ def polynomial_regression_section() -> rx.Component:
     )
 
 
+@cache
 def ridge_regression_detail() -> rx.Component:
     """Ridge Regression - L2 Regularization for multicollinearity."""
-    
-    # Metrics comparison data
-    metrics_data = [
-        ["Linear Regression", "0.947", "0.928", "13427.07", "115.88", "77.06"],
-        ["Ridge Regression", "0.947", "0.928", "13427.07", "115.88", "77.06"]
-    ]
-    
-    # Coefficients comparison data
-    coef_data = [
-        ["Silver_Futures", "25.49", "25.79"],
-        ["Unemployment", "32.04", "24.39"],
-        ["CPI", "10.20", "10.73"],
-        ["VIX", "1.51", "2.22"],
-        ["S&P_500", "0.10", "0.09"],
-        ["GPR", "0.22", "0.06"],
-        ["GPRA", "0.08", "0.04"],
-        ["Crude_Oil", "-2.20", "-2.86"],
-        ["Fed_Funds_Rate", "5.12", "-4.88"],
-        ["Real_Interest_Rate", "24.05", "-5.09"],
-        ["Treasury_Yield_10Y", "-52.38", "-8.13"],
-        ["USD_Index", "-7.84", "-8.35"]
-    ]
-    
     return rx.vstack(
         rx.heading("Ridge Regression: L2 Regularization Test", size="6", weight="bold", margin_bottom="1em"),
         
@@ -1418,383 +1595,261 @@ def ridge_regression_detail() -> rx.Component:
         ),
         
         # Metrics Comparison Table
-        rx.box(
-            rx.vstack(
-                rx.heading("Performance Comparison: Linear vs Ridge", size="5", weight="bold", margin_bottom="1em"),
-                
-                rx.table.root(
-                    rx.table.header(
-                        rx.table.row(
-                            rx.table.column_header_cell("Model"),
-                            rx.table.column_header_cell("R²"),
-                            rx.table.column_header_cell("Adj R²"),
-                            rx.table.column_header_cell("MSE"),
-                            rx.table.column_header_cell("RMSE"),
-                            rx.table.column_header_cell("MAE"),
-                        )
-                    ),
-                    rx.table.body(
-                        *[
-                            rx.table.row(
-                                rx.table.cell(row[0]),
-                                rx.table.cell(rx.badge(row[1], color_scheme="green", size="2")),
-                                rx.table.cell(rx.badge(row[2], color_scheme="green", size="2")),
-                                rx.table.cell(row[3]),
-                                rx.table.cell(row[4]),
-                                rx.table.cell(row[5]),
-                            )
-                            for row in metrics_data
-                        ]
-                    ),
-                    variant="surface",
-                    size="3",
-                    width="100%",
-                    margin_bottom="1em"
-                ),
-                
-                rx.text(
-                    rx.text.strong("Observation: "),
-                    "Ridge produces ",
-                    rx.text.strong("identical metrics"),
-                    " to OLS Linear Regression (R² = 0.947, RMSE = $115.88). "
-                    "This indicates that while multicollinearity exists in the data, ",
-                    rx.text.strong("it does not degrade predictive performance"),
-                    ". "
-                    "The regularization constraint had no impact on test set predictions.",
-                    size="3",
-                    color="var(--gray-11)",
-                    line_height="1.6",
-                    margin_top="0.5em"
+        _card(
+            rx.heading("Performance Comparison: Linear vs Ridge", size="5", weight="bold", margin_bottom="1em"),
+            
+            rx.table.root(
+                rx.table.header(
+                    rx.table.row(
+                        rx.table.column_header_cell("Model"),
+                        rx.table.column_header_cell("R²"),
+                        rx.table.column_header_cell("Adj R²"),
+                        rx.table.column_header_cell("MSE"),
+                        rx.table.column_header_cell("RMSE"),
+                        rx.table.column_header_cell("MAE"),
+                    )
                 ),
-                
-                spacing="2",
-                align="start"
+                rx.table.body(*[_ridge_metric_row(*row) for row in _RIDGE_METRICS]),
+                variant="surface",
+                size="3",
+                width="100%",
+                margin_bottom="1em"
+            ),
+            
+            rx.text(
+                rx.text.strong("Observation: "),
+                "Ridge produces ",
+                rx.text.strong("identical metrics"),
+                " to OLS Linear Regression (R² = 0.947, RMSE = $115.88). "
+                "This indicates that while multicollinearity exists in the data, ",
+                rx.text.strong("it does not degrade predictive performance"),
+                ". "
+                "The regularization constraint had no impact on test set predictions.",
+                size="3",
+                color="var(--gray-11)",
+                line_height="1.6",
+                margin_top="0.5em"
             ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-4)",
             margin_bottom="1.5em"
         ),
         
         # Coefficients Comparison Table
-        rx.box(
-            rx.vstack(
-                rx.heading("Coefficient Comparison: Regularization Effects", size="5", weight="bold", margin_bottom="1em"),
-                
-                rx.table.root(
-                    rx.table.header(
-                        rx.table.row(
-                            rx.table.column_header_cell("Feature"),
-                            rx.table.column_header_cell("Linear Coefficient"),
-                            rx.table.column_header_cell("Ridge Coefficient"),
-                        )
-                    ),
-                    rx.table.body(
-                        *[
-                            rx.table.row(
-                                rx.table.cell(row[0]),
-                                rx.table.cell(row[1]),
-                                rx.table.cell(row[2]),
-                            )
-                            for row in coef_data
-                        ]
-                    ),
-                    variant="surface",
-                    size="3",
-                    width="100%",
-                    margin_bottom="1em"
-                ),
-                
-                rx.vstack(
-                    rx.hstack(
-                        rx.icon("lightbulb", size=20, color=rx.color("purple", 9)),
-                        rx.heading("Coefficient Interpretation", size="4", weight="bold"),
-                        spacing="2",
-                        align="center",
-                        margin_bottom="0.5em"
-                    ),
-                    rx.unordered_list(
-                        rx.list_item(
-                            rx.text.strong("Silver_Futures (25.49→25.79): "),
-                            "Minimal change (+1.2%) indicates a ",
-                            rx.text.strong("stable, independent predictor"),
-                            " with low multicollinearity"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("Unemployment (32.04→24.39): "),
-                            "Moderate shrinkage (-23.9%) shows some correlation with macro variables but remains positive (safe haven effect)"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("CPI (10.20→10.73): "),
-                            "Slight increase (+5.2%) - regularization stabilizes coefficient while maintaining inflation hedge relationship"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("VIX (1.51→2.22): "),
-                            "Increases by 47% under Ridge - originally suppressed by multicollinearity, now reveals stronger volatility signal"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("Sign flips (red flags): "),
-                            rx.text.strong("Fed_Funds_Rate (5.12→-4.88)"),
-                            " and ",
-                            rx.text.strong("Real_Interest_Rate (24.05→-5.09)"),
-                            " reverse direction. This indicates extreme multicollinearity - coefficients are unstable and unreliable"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("Treasury_Yield_10Y (-52.38→-8.13): "),
-                            "Massive 84.5% shrinkage confirms severe multicollinearity (VIF=179.92) with interest rate variables"
-                        ),
-                        rx.list_item(
-                            rx.text.strong("USD_Index (-7.84→-8.35): "),
-                            "Small increase in magnitude (+6.5%) shows stable negative relationship with gold prices"
-                        ),
-                        spacing="2",
-                        padding_left="1.5em"
-                    ),
-                    spacing="2",
-                    align="start"
+        _card(
+            rx.heading("Coefficient Comparison: Regularization Effects", size="5", weight="bold", margin_bottom="1em"),
+            
+            rx.table.root(
+                rx.table.header(
+                    rx.table.row(
+                        rx.table.column_header_cell("Feature"),
+                        rx.table.column_header_cell("Linear Coefficient"),
+                        rx.table.column_header_cell("Ridge Coefficient"),
+                    )
                 ),
-                
-                spacing="3",
-                align="start"
+                rx.table.body(*[_ridge_coef_row(*row) for row in _RIDGE_COEFS]),
+                variant="surface",
+                size="3",
+                width="100%",
+                margin_bottom="1em"
             ),
-            padding="1.5em",
-            background=rx.color("purple", 1),
-            border="1px solid",
-            border_color=rx.color("purple", 5),
-            border_radius="var(--radius-4)",
-            margin_bottom="1.5em"
-        ),
-        
-        # Final Verdict
-        rx.box(
+            
             rx.vstack(
                 rx.hstack(
-                    rx.icon("info", size=24, color=rx.color("cyan", 9)),
-                    rx.heading("Decision: Retain Linear Regression", size="4", weight="bold"),
+                    rx.icon("lightbulb", size=20, color=_C.purple_9),
+                    rx.heading("Coefficient Interpretation", size="4", weight="bold"),
                     spacing="2",
                     align="center",
                     margin_bottom="0.5em"
                 ),
-                rx.text(
-                    "Despite severe multicollinearity, ",
-                    rx.text.strong("Ridge regularization provides no predictive benefit"),
-                    " (identical R² and RMSE). The coefficient instability (sign flips, shrinkage) confirms multicollinearity exists, but ",
-                    rx.text.strong("it does not harm generalization performance"),
-                    ". "
-                    "This occurs because correlated features (CPI, USD Index, Treasury Yield, Real Interest Rate) capture ",
-                    rx.text.strong("genuine economic relationships"),
-                    " - their correlation reflects reality, not noise. "
-                    "Removing features would sacrifice information without improving predictions.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7",
-                    margin_bottom="1em"
-                ),
-                rx.text(
-                    rx.text.strong("Modeling decision: "),
-                    "We retain all 12 features in standard Linear Regression. "
-                    "The multicollinearity reflects the interconnected nature of macroeconomic variables (e.g., inflation drives both CPI and interest rates). "
-                    "Regularization shrinks coefficients but does not improve out-of-sample accuracy.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
-                spacing="2",
-                align="start"
-            ),
-            padding="1.25em",
-            background=rx.color("cyan", 2),
-            border_left=f"4px solid {rx.color('cyan', 9)}",
-            border_radius="var(--radius-3)",
-            margin_top="1em"
-        ),
-        
-        spacing="3",
-        align="start",
-        width="100%",
-        margin_bottom="2em"
-    )
-
-
-def time_series_section() -> rx.Component:
-    """ARIMA/SARIMA with detailed parameter explanations."""
-    return rx.vstack(
-        rx.heading("Time Series Models: ARIMA and SARIMA", size="6", weight="bold", margin_bottom="1em"),
-        
-        rx.text(
-            "Can we predict gold prices using only historical patterns without external economic data? "
-            "We tested traditional time series models (ARIMA and SARIMA) that rely solely on past gold price values and their temporal structure.",
-            size="4",
-            color="var(--gray-12)",
-            line_height="1.7",
-            margin_bottom="1.5em"
-        ),
-        
-        # Explanation of ARIMA/SARIMA parameters
-        rx.box(
-            rx.vstack(
-                rx.heading("Understanding ARIMA and SARIMA Parameters", size="5", weight="bold", margin_bottom="1em"),
-                
-                rx.heading("ARIMA (p, d, q): AutoRegressive Integrated Moving Average", size="4", weight="bold", margin_bottom="0.75em", color=rx.color("blue", 10)),
-                rx.grid(
-                    rx.vstack(
-                        rx.text.strong("p (AutoRegressive order)"),
-                        rx.text(
-                            "Number of past time steps (lags) used to predict the current value. "
-                            "For ARIMA(1,1,1), p=1 means the model uses the previous month's price to predict the next month.",
-                            size="2",
-                            color="var(--gray-12)",
-                            line_height="1.6"
-                        ),
-                        align="start",
-                        spacing="1"
+                rx.unordered_list(
+                    rx.list_item(
+                        rx.text.strong("Silver_Futures (25.49→25.79): "),
+                        "Minimal change (+1.2%) indicates a ",
+                        rx.text.strong("stable, independent predictor"),
+                        " with low multicollinearity"
                     ),
-                    rx.vstack(
-                        rx.text.strong("d (Differencing order)"),
-                        rx.text(
-                            "Number of times the series is differenced to make it stationary (remove trends). "
-                            "d=1 means we model the change in gold price (first derivative) rather than raw prices.",
-                            size="2",
-                            color="var(--gray-12)",
-                            line_height="1.6"
-                        ),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("Unemployment (32.04→24.39): "),
+                        "Moderate shrinkage (-23.9%) shows some correlation with macro variables but remains positive (safe haven effect)"
                     ),
-                    rx.vstack(
-                        rx.text.strong("q (Moving Average order)"),
-                        rx.text(
-                            "Number of past forecast errors used to correct predictions. "
-                            "q=1 means the model learns from the previous prediction error to improve the next forecast.",
-                            size="2",
-                            color="var(--gray-12)",
-                            line_height="1.6"
-                        ),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("CPI (10.20→10.73): "),
+                        "Slight increase (+5.2%) - regularization stabilizes coefficient while maintaining inflation hedge relationship"
                     ),
-                    columns="3",
-                    spacing="3",
-                    width="100%",
-                    margin_bottom="1.5em"
-                ),
-                
-                rx.heading("SARIMA (p,d,q)x(P,D,Q,s): Seasonal ARIMA", size="4", weight="bold", margin_bottom="0.75em", color=rx.color("purple", 10)),
-                rx.text(
-                    "SARIMA extends ARIMA by adding seasonal components. Our model SARIMA(1,1,1)x(1,1,1,12) includes:",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7",
-                    margin_bottom="0.75em"
-                ),
-                rx.grid(
-                    rx.vstack(
-                        rx.text.strong("P (Seasonal AR)"),
-                        rx.text("Uses prices from 12 months ago (P=1)", size="2", color="var(--gray-12)"),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("VIX (1.51→2.22): "),
+                        "Increases by 47% under Ridge - originally suppressed by multicollinearity, now reveals stronger volatility signal"
                     ),
-                    rx.vstack(
-                        rx.text.strong("D (Seasonal Differencing)"),
-                        rx.text("Removes yearly trends (D=1)", size="2", color="var(--gray-12)"),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("Sign flips (red flags): "),
+                        rx.text.strong("Fed_Funds_Rate (5.12→-4.88)"),
+                        " and ",
+                        rx.text.strong("Real_Interest_Rate (24.05→-5.09)"),
+                        " reverse direction. This indicates extreme multicollinearity - coefficients are unstable and unreliable"
                     ),
-                    rx.vstack(
-                        rx.text.strong("Q (Seasonal MA)"),
-                        rx.text("Corrects using errors from 12 months ago (Q=1)", size="2", color="var(--gray-12)"),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("Treasury_Yield_10Y (-52.38→-8.13): "),
+                        "Massive 84.5% shrinkage confirms severe multicollinearity (VIF=179.92) with interest rate variables"
                     ),
-                    rx.vstack(
-                        rx.text.strong("s (Seasonal period)"),
-                        rx.text("12 months - captures annual patterns", size="2", color="var(--gray-12)"),
-                        align="start",
-                        spacing="1"
+                    rx.list_item(
+                        rx.text.strong("USD_Index (-7.84→-8.35): "),
+                        "Small increase in magnitude (+6.5%) shows stable negative relationship with gold prices"
                     ),
-                    columns="4",
-                    spacing="3",
-                    width="100%"
+                    spacing="2",
+                    padding_left="1.5em"
                 ),
+                spacing="2",
+                align="start"
+            ),
+            tone="purple",
+            spacing="3",
+            margin_bottom="1.5em"
+        ),
+        
+        # Final Verdict
+        _callout(
+            rx.hstack(
+                rx.icon("info", size=24, color=_C.cyan_9),
+                rx.heading("Decision: Retain Linear Regression", size="4", weight="bold"),
+                spacing="2",
+                align="center",
+                margin_bottom="0.5em"
+            ),
+            rx.text(
+                "Despite severe multicollinearity, ",
+                rx.text.strong("Ridge regularization provides no predictive benefit"),
+                " (identical R² and RMSE). The coefficient instability (sign flips, shrinkage) confirms multicollinearity exists, but ",
+                rx.text.strong("it does not harm generalization performance"),
+                ". "
+                "This occurs because correlated features (CPI, USD Index, Treasury Yield, Real Interest Rate) capture ",
+                rx.text.strong("genuine economic relationships"),
+                " - their correlation reflects reality, not noise. "
+                "Removing features would sacrifice information without improving predictions.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7",
+                margin_bottom="1em"
+            ),
+            rx.text(
+                rx.text.strong("Modeling decision: "),
+                "We retain all 12 features in standard Linear Regression. "
+                "The multicollinearity reflects the interconnected nature of macroeconomic variables (e.g., inflation drives both CPI and interest rates). "
+                "Regularization shrinks coefficients but does not improve out-of-sample accuracy.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7"
+            ),
+            tone="cyan",
+            margin_top="1em"
+        ),
+        
+        spacing="3",
+        align="start",
+        width="100%",
+        margin_bottom="2em"
+    )
+
+
+@cache
+def time_series_section() -> rx.Component:
+    """ARIMA/SARIMA with detailed parameter explanations."""
+    return rx.vstack(
+        rx.heading("Time Series Models: ARIMA and SARIMA", size="6", weight="bold", margin_bottom="1em"),
+        
+        rx.text(
+            "Can we predict gold prices using only historical patterns without external economic data? "
+            "We tested traditional time series models (ARIMA and SARIMA) that rely solely on past gold price values and their temporal structure.",
+            size="4",
+            color="var(--gray-12)",
+            line_height="1.7",
+            margin_bottom="1.5em"
+        ),
+        
+        # Explanation of ARIMA/SARIMA parameters
+        _card(
+            rx.heading("Understanding ARIMA and SARIMA Parameters", size="5", weight="bold", margin_bottom="1em"),
+            
+            rx.heading("ARIMA (p, d, q): AutoRegressive Integrated Moving Average", size="4", weight="bold", margin_bottom="0.75em", color=_C.blue_10),
+            rx.grid(
+                *[_param_item(*param) for param in _ARIMA_PARAMS],
+                columns="3",
                 spacing="3",
-                align="start"
+                width="100%",
+                margin_bottom="1.5em"
             ),
-            padding="1.5em",
-            background=rx.color("blue", 1),
-            border="1px solid",
-            border_color=rx.color("blue", 5),
-            border_radius="var(--radius-4)",
+            
+            rx.heading("SARIMA (p,d,q)x(P,D,Q,s): Seasonal ARIMA", size="4", weight="bold", margin_bottom="0.75em", color=_C.purple_10),
+            rx.text(
+                "SARIMA extends ARIMA by adding seasonal components. Our model SARIMA(1,1,1)x(1,1,1,12) includes:",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7",
+                margin_bottom="0.75em"
+            ),
+            rx.grid(
+                *[_param_item(*param) for param in _SARIMA_PARAMS],
+                columns="4",
+                spacing="3",
+                width="100%"
+            ),
+            tone="blue",
+            spacing="3",
             margin_bottom="1.5em"
         ),
         
         # Results comparison
         rx.heading("Model Results", size="5", weight="bold", margin_bottom="1em"),
         rx.grid(
-            rx.box(
-                rx.vstack(
-                    rx.heading("ARIMA (1,1,1)", size="5", weight="bold", margin_bottom="0.5em"),
-                    rx.heading("R² = -0.480", size="6", weight="bold", color=rx.color("red", 10), margin_bottom="0.5em"),
-                    rx.text(
-                        rx.text.strong("RMSE: "), "$503.12 | ",
-                        rx.text.strong("MAE: "), "$321.93",
-                        size="2",
-                        color="var(--gray-11)",
-                        margin_bottom="0.75em"
-                    ),
-                    rx.text(
-                        rx.text.strong("Negative R²"),
-                        " indicates the model performs ",
-                        rx.text.strong("worse than simply predicting the mean"),
-                        " gold price. "
-                        "Autoregressive patterns alone cannot explain gold price movements. ",
-                        rx.text.strong("Gold responds to economic events, not just past values"),
-                        ".",
-                        size="2",
-                        color="var(--gray-12)",
-                        line_height="1.6"
-                    ),
-                    spacing="1",
-                    align="start"
+            _card(
+                rx.heading("ARIMA (1,1,1)", size="5", weight="bold", margin_bottom="0.5em"),
+                rx.heading("R² = -0.480", size="6", weight="bold", color=_C.red_10, margin_bottom="0.5em"),
+                rx.text(
+                    rx.text.strong("RMSE: "), "$503.12 | ",
+                    rx.text.strong("MAE: "), "$321.93",
+                    size="2",
+                    color="var(--gray-11)",
+                    margin_bottom="0.75em"
                 ),
-                padding="1.25em",
-                background=rx.color("red", 1),
-                border="1px solid",
-                border_color=rx.color("red", 5),
-                border_radius="var(--radius-4)"
+                rx.text(
+                    rx.text.strong("Negative R²"),
+                    " indicates the model performs ",
+                    rx.text.strong("worse than simply predicting the mean"),
+                    " gold price. "
+                    "Autoregressive patterns alone cannot explain gold price movements. ",
+                    rx.text.strong("Gold responds to economic events, not just past values"),
+                    ".",
+                    size="2",
+                    color="var(--gray-12)",
+                    line_height="1.6"
+                ),
+                tone="red",
+                spacing="1",
+                padding="1.25em"
             ),
             
-            rx.box(
-                rx.vstack(
-                    rx.heading("SARIMA (1,1,1)x(1,1,1,12)", size="5", weight="bold", margin_bottom="0.5em"),
-                    rx.heading("R² = 0.270", size="6", weight="bold", color=rx.color("orange", 10), margin_bottom="0.5em"),
-                    rx.text(
-                        rx.text.strong("RMSE: "), "$353.57 | ",
-                        rx.text.strong("MAE: "), "$233.26",
-                        size="2",
-                        color="var(--gray-11)",
-                        margin_bottom="0.75em"
-                    ),
-                    rx.text(
-                        rx.text.strong("Seasonal component improves performance"),
-                        " substantially but still explains ",
-                        rx.text.strong("only 27% of variance"),
-                        ". Monthly seasonality exists but remains ",
-                        rx.text.strong("weak compared to macroeconomic drivers"),
-                        " (CPI alone explains 72%).",
-                        size="2",
-                        color="var(--gray-12)",
-                        line_height="1.6"
-                    ),
-                    spacing="1",
-                    align="start"
+            _card(
+                rx.heading("SARIMA (1,1,1)x(1,1,1,12)", size="5", weight="bold", margin_bottom="0.5em"),
+                rx.heading("R² = 0.270", size="6", weight="bold", color=_C.orange_10, margin_bottom="0.5em"),
+                rx.text(
+                    rx.text.strong("RMSE: "), "$353.57 | ",
+                    rx.text.strong("MAE: "), "$233.26",
+                    size="2",
+                    color="var(--gray-11)",
+                    margin_bottom="0.75em"
                 ),
-                padding="1.25em",
-                background=rx.color("orange", 1),
-                border="1px solid",
-                border_color=rx.color("orange", 5),
-                border_radius="var(--radius-4)"
+                rx.text(
+                    rx.text.strong("Seasonal component improves performance"),
+                    " substantially but still explains ",
+                    rx.text.strong("only 27% of variance"),
+                    ". Monthly seasonality exists but remains ",
+                    rx.text.strong("weak compared to macroeconomic drivers"),
+                    " (CPI alone explains 72%).",
+                    size="2",
+                    color="var(--gray-12)",
+                    line_height="1.6"
+                ),
+                tone="orange",
+                spacing="1",
+                padding="1.25em"
             ),
 
 
@@ -1805,66 +1860,44 @@ def time_series_section() -> rx.Component:
         ),
         
         # ARIMA Forecast Visualization
-        rx.box(
-            rx.vstack(
-                rx.heading("ARIMA Forecast vs Actual Gold Prices", size="5", weight="bold", margin_bottom="1em"),
-                rx.image(
-                    src="/modeling_plots/arima/arima_forcast.png",
-                    width="100%",
-                    border_radius="var(--radius-3)",
-                    border="1px solid",
-                    border_color=rx.color("gray", 5)
-                ),
-                rx.text(
-                    "Train series (blue) shows historical patterns. SARIMA forecast (green) diverges from actual test values (black), "
-                    "demonstrating the model's inability to capture gold price movements driven by external economic factors.",
-                    size="2",
-                    color="var(--gray-11)",
-                    line_height="1.6",
-                    margin_top="0.5em"
-                ),
-                spacing="2",
-                align="start"
+        _card(
+            rx.heading("ARIMA Forecast vs Actual Gold Prices", size="5", weight="bold", margin_bottom="1em"),
+            _plot_image("/modeling_plots/arima/arima_forcast.png"),
+            rx.text(
+                "Train series (blue) shows historical patterns. SARIMA forecast (green) diverges from actual test values (black), "
+                "demonstrating the model's inability to capture gold price movements driven by external economic factors.",
+                size="2",
+                color="var(--gray-11)",
+                line_height="1.6",
+                margin_top="0.5em"
             ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-4)",
             margin_top="1.5em"
         ),
         
-        rx.box(
-            rx.vstack(
-                rx.hstack(
-                    rx.icon("triangle-alert", size=24, color=rx.color("red", 9)),
-                    rx.heading("Why Time Series Models Failed", size="4", weight="bold"),
-                    spacing="2",
-                    align="center",
-                    margin_bottom="0.5em"
-                ),
-                rx.text(
-                    "Time series models assume future values depend primarily on past values and temporal patterns. ",
-                    rx.text.strong("Gold prices violate this assumption"),
-                    " because they are ",
-                    rx.text.strong("fundamentally driven by external economic factors"),
-                    ": inflation expectations, interest rate policy, currency strength, and geopolitical risk. ",
-                    rx.text.strong("Historical patterns alone miss these fundamental drivers"),
-                    ". This limitation provides a clear hypothesis: "
-                    "we need ",
-                    rx.text.strong("Multiple models that can incorporate external economic data"),
-                    " to capture what truly drives gold prices.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
+        _callout(
+            rx.hstack(
+                rx.icon("triangle-alert", size=24, color=_C.red_9),
+                rx.heading("Why Time Series Models Failed", size="4", weight="bold"),
                 spacing="2",
-                align="start"
+                align="center",
+                margin_bottom="0.5em"
             ),
-            padding="1.25em",
-            background=rx.color("red", 2),
-            border_left=f"4px solid {rx.color('red', 9)}",
-            border_radius="var(--radius-3)",
+            rx.text(
+                "Time series models assume future values depend primarily on past values and temporal patterns. ",
+                rx.text.strong("Gold prices violate this assumption"),
+                " because they are ",
+                rx.text.strong("fundamentally driven by external economic factors"),
+                ": inflation expectations, interest rate policy, currency strength, and geopolitical risk. ",
+                rx.text.strong("Historical patterns alone miss these fundamental drivers"),
+                ". This limitation provides a clear hypothesis: "
+                "we need ",
+                rx.text.strong("Multiple models that can incorporate external economic data"),
+                " to capture what truly drives gold prices.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7"
+            ),
+            tone="red",
             margin_top="1em"
         ),
         
@@ -1875,16 +1908,9 @@ def time_series_section() -> rx.Component:
     )
 
 
+@cache
 def baseline_models() -> rx.Component:
     """Baseline models comparison table."""
-    baseline_data = [
-        ["Linear Regression", "0.947", "$115.88", "$77.06", "Strong Multiple baseline"],
-        ["Ridge Regression", "0.947", "$115.88", "$77.06", "No improvement"],
-        ["Polynomial (degree=2)", "0.537", "$342.78", "$270.69", "Best simple: Silver"],
-        ["ARIMA (1,1,1)", "-0.480", "$503.12", "$321.93", "Failed - worse than mean"],
-        ["SARIMA (1,1,1)x(1,1,1,12)", "0.270", "$353.57", "$233.26", "Poor - weak seasonality"]
-    ]
-    
     return rx.vstack(
         rx.heading("Baseline Models Summary", size="6", weight="bold", margin_bottom="1em"),
         
@@ -1898,68 +1924,31 @@ def baseline_models() -> rx.Component:
                     rx.table.column_header_cell("Notes"),
                 )
             ),
-            rx.table.body(
-                *[
-                    rx.table.row(
-                        rx.table.cell(
-                            rx.hstack(
-                                rx.text(row[0]),
-                                rx.cond(
-                                    i == 0,
-                                    rx.icon("trophy", size=16, color=rx.color("amber", 9)),
-                                    rx.fragment()
-                                ),
-                                spacing="2",
-                                align="center"
-                            )
-                        ),
-                        rx.table.cell(rx.badge(
-                            row[1], 
-                            color_scheme="green" if float(row[1]) > 0.9 else ("blue" if float(row[1]) > 0 else "red"), 
-                            size="2"
-                        )),
-                        rx.table.cell(row[2]),
-                        rx.table.cell(row[3]),
-                        rx.table.cell(row[4]),
-                        style={
-                            "background": rx.color("green", 2) if i == 0 else "transparent",
-                            "font_weight": "bold" if i == 0 else "normal"
-                        }
-                    )
-                    for i, row in enumerate(baseline_data)
-                ]
-            ),
+            rx.table.body(*[_model_row(*row, best=i == 0) for i, row in enumerate(_BASELINE_ROWS)]),
             variant="surface",
             size="3",
             width="100%",
             margin_bottom="1em"
         ),
         
-        rx.box(
-            rx.vstack(
-                rx.hstack(
-                    rx.icon("circle-check", size=24, color=rx.color("green", 9)),
-                    rx.heading("Best Baseline: Multiple Linear Regression", size="4", weight="bold"),
-                    spacing="2",
-                    align="center",
-                    margin_bottom="0.5em"
-                ),
-                rx.text(
-                    rx.text.strong("R²=0.947"),
-                    " indicates 95% of gold price variance explained. The Multiple approach combining inflation, "
-                    "interest rates, stock market, and currency data substantially outperforms all simple and time series methods. "
-                    "This demonstrates that gold prices are driven by macroeconomic interactions rather than single factors or historical patterns.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
+        _callout(
+            rx.hstack(
+                rx.icon("circle-check", size=24, color=_C.green_9),
+                rx.heading("Best Baseline: Multiple Linear Regression", size="4", weight="bold"),
                 spacing="2",
-                align="start"
+                align="center",
+                margin_bottom="0.5em"
             ),
-            padding="1.25em",
-            background=rx.color("green", 2),
-            border_left=f"4px solid {rx.color('green', 9)}",
-            border_radius="var(--radius-3)"
+            rx.text(
+                rx.text.strong("R²=0.947"),
+                " indicates 95% of gold price variance explained. The Multiple approach combining inflation, "
+                "interest rates, stock market, and currency data substantially outperforms all simple and time series methods. "
+                "This demonstrates that gold prices are driven by macroeconomic interactions rather than single factors or historical patterns.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.7"
+            ),
+            tone="green"
         ),
         
         spacing="3",
@@ -1969,20 +1958,15 @@ def baseline_models() -> rx.Component:
     )
 
 
+@cache
 def traditional_ml() -> rx.Component:
     """Traditional ML models comparison."""
-    ml_data = [
-        ["Support Vector Regression (SVR)", "0.986", "$59.93", "$43.77", "GridSearch: C=100, gamma=0.01"],
-        ["Random Forest", "0.974", "$80.46", "$55.39", "500 trees, depth=20, 1620 CV fits"],
-        ["XGBoost", "0.973", "$82.67", "$51.11", "Slightly underperformed than others"]
-    ]
-    
     return rx.vstack(
         comparison_table_section(
             "Traditional Machine Learning: Non-Linear Methods",
             "Moving beyond linear assumptions, we test kernel-based (SVR) and tree-based (Random Forest, XGBoost) methods. "
             "These models can capture non-linear relationships and feature interactions.",
-            ml_data
+            _ML_ROWS
         ),
         
         # Key highlights
@@ -1998,95 +1982,63 @@ def traditional_ml() -> rx.Component:
                 line_height="1.7"
             ),
             padding="1em",
-            background=rx.color("green", 2),
-            border_left=f"4px solid {rx.color('green', 9)}",
+            background=_C.green_2,
+            border_left=_BORDERS["green", 9, 4],
             border_radius="var(--radius-3)",
             margin_bottom="1em"
         ),
         
         # SVR Section
         rx.heading("Support Vector Regression (SVR)", size="5", weight="bold", margin_bottom="1em"),
-        rx.box(
-            rx.vstack(
-                rx.text(
-                    "Support Vector Regression with RBF kernel maps features into high-dimensional space, "
-                    "capturing complex non-linear patterns. GridSearchCV tested 27 combinations to find optimal hyperparameters.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.6",
-                    margin_bottom="0.75em"
-                ),
-                rx.unordered_list(
-                    rx.list_item("Best C=100 (regularization strength)"),
-                    rx.list_item("Best gamma=0.01 (kernel coefficient)"),
-                    rx.list_item("Best epsilon=0.01 (margin tolerance)"),
-                    spacing="1",
-                    padding_left="1em"
-                ),
-                spacing="2",
-                align="start"
+        _card(
+            rx.text(
+                "Support Vector Regression with RBF kernel maps features into high-dimensional space, "
+                "capturing complex non-linear patterns. GridSearchCV tested 27 combinations to find optimal hyperparameters.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.6",
+                margin_bottom="0.75em"
+            ),
+            rx.unordered_list(
+                rx.list_item("Best C=100 (regularization strength)"),
+                rx.list_item("Best gamma=0.01 (kernel coefficient)"),
+                rx.list_item("Best epsilon=0.01 (margin tolerance)"),
+                spacing="1",
+                padding_left="1em"
             ),
+            tone="blue",
             padding="1.25em",
-            background=rx.color("blue", 1),
-            border="1px solid",
-            border_color=rx.color("blue", 5),
             border_radius="var(--radius-3)",
             margin_bottom="1.5em"
         ),
         
         # SVR Visualizations
         rx.grid(
-            rx.box(
-                rx.vstack(
-                    rx.heading("SVR: Predicted vs Actual", size="4", weight="bold", margin_bottom="0.5em"),
-                    rx.image(
-                        src="/modeling_plots/svr/pred_vs_actual.png",
-                        width="100%",
-                        border_radius="var(--radius-3)",
-                        border="1px solid",
-                        border_color=rx.color("gray", 5)
-                    ),
-                    rx.text(
-                        "Tight clustering around diagonal line (y=x) demonstrates SVR's ability to capture non-linear patterns with R²=0.986.",
-                        size="2",
-                        color="var(--gray-11)",
-                        line_height="1.6",
-                        margin_top="0.5em"
-                    ),
-                    spacing="2",
-                    align="start"
+            _card(
+                rx.heading("SVR: Predicted vs Actual", size="4", weight="bold", margin_bottom="0.5em"),
+                _plot_image("/modeling_plots/svr/pred_vs_actual.png"),
+                rx.text(
+                    "Tight clustering around diagonal line (y=x) demonstrates SVR's ability to capture non-linear patterns with R²=0.986.",
+                    size="2",
+                    color="var(--gray-11)",
+                    line_height="1.6",
+                    margin_top="0.5em"
                 ),
                 padding="1.25em",
-                background=rx.color("gray", 1),
-                border="1px solid",
-                border_color=rx.color("gray", 5),
                 border_radius="var(--radius-3)"
             ),
             
-            rx.box(
-                rx.vstack(
-                    rx.heading("SVR: Residual Distribution", size="4", weight="bold", margin_bottom="0.5em"),
-                    rx.image(
-                        src="/modeling_plots/svr/residuals_dist.png",
-                        width="100%",
-                        border_radius="var(--radius-3)",
-                        border="1px solid",
-                        border_color=rx.color("gray", 5)
-                    ),
-                    rx.text(
-                        "Residuals are approximately normal with small variance, confirming reliable model performance across price ranges.",
-                        size="2",
-                        color="var(--gray-11)",
-                        line_height="1.6",
-                        margin_top="0.5em"
-                    ),
-                    spacing="2",
-                    align="start"
+            _card(
+                rx.heading("SVR: Residual Distribution", size="4", weight="bold", margin_bottom="0.5em"),
+                _plot_image("/modeling_plots/svr/residuals_dist.png"),
+                rx.text(
+                    "Residuals are approximately normal with small variance, confirming reliable model performance across price ranges.",
+                    size="2",
+                    color="var(--gray-11)",
+                    line_height="1.6",
+                    margin_top="0.5em"
                 ),
                 padding="1.25em",
-                background=rx.color("gray", 1),
-                border="1px solid",
-                border_color=rx.color("gray", 5),
                 border_radius="var(--radius-3)"
             ),
             
@@ -2098,61 +2050,40 @@ def traditional_ml() -> rx.Component:
         
         # Random Forest Section
         rx.heading("Random Forest", size="5", weight="bold", margin_bottom="1em"),
-        rx.box(
-            rx.vstack(
-                rx.text(
-                    "Random Forest trains 500 decision trees on random subsets of features, then averages predictions. "
-                    "This ensemble approach reduces overfitting while capturing non-linear patterns.",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.6",
-                    margin_bottom="0.75em"
-                ),
-                rx.unordered_list(
-                    rx.list_item("500 estimators (trees)"),
-                    rx.list_item("Max depth = 20 layers"),
-                    rx.list_item("1,620 CV fits (5-fold x 324 configs)"),
-                    spacing="1",
-                    padding_left="1em"
-                ),
-                spacing="2",
-                align="start"
-            ),
-            padding="1.25em",
-            background=rx.color("green", 1),
-            border="1px solid",
-            border_color=rx.color("green", 5),
-            border_radius="var(--radius-3)",
-            margin_bottom="1.5em"
-        ),
-        
-        # Random Forest Feature Importance
-        rx.box(
-            rx.vstack(
-                rx.heading("Random Forest Feature Importance", size="4", weight="bold", margin_bottom="1em"),
-                rx.image(
-                    src="/modeling_plots/random_forest/feature_importance.png",
-                    width="100%",
-                    border_radius="var(--radius-3)",
-                    border="1px solid",
-                    border_color=rx.color("gray", 5)
-                ),
-                rx.text(
-                    "Top 3 features highlighted in gold: Silver Futures, CPI (inflation), and S&P 500. "
-                    "Tree-based models confirm macroeconomic drivers identified in simple analysis.",
-                    size="2",
-                    color="var(--gray-11)",
-                    line_height="1.6",
-                    margin_top="0.5em"
-                ),
-                spacing="2",
-                align="start"
+        _card(
+            rx.text(
+                "Random Forest trains 500 decision trees on random subsets of features, then averages predictions. "
+                "This ensemble approach reduces overfitting while capturing non-linear patterns.",
+                size="3",
+                color="var(--gray-12)",
+                line_height="1.6",
+                margin_bottom="0.75em"
+            ),
+            rx.unordered_list(
+                rx.list_item("500 estimators (trees)"),
+                rx.list_item("Max depth = 20 layers"),
+                rx.list_item("1,620 CV fits (5-fold x 324 configs)"),
+                spacing="1",
+                padding_left="1em"
+            ),
+            tone="green",
+            padding="1.25em",
+            border_radius="var(--radius-3)",
+            margin_bottom="1.5em"
+        ),
+        
+        # Random Forest Feature Importance
+        _card(
+            rx.heading("Random Forest Feature Importance", size="4", weight="bold", margin_bottom="1em"),
+            _plot_image("/modeling_plots/random_forest/feature_importance.png"),
+            rx.text(
+                "Top 3 features highlighted in gold: Silver Futures, CPI (inflation), and S&P 500. "
+                "Tree-based models confirm macroeconomic drivers identified in simple analysis.",
+                size="2",
+                color="var(--gray-11)",
+                line_height="1.6",
+                margin_top="0.5em"
             ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-4)",
             margin_bottom="1.5em"
         ),
         
@@ -2167,8 +2098,8 @@ def traditional_ml() -> rx.Component:
                 line_height="1.7"
             ),
             padding="1.25em",
-            background=rx.color("amber", 2),
-            border_left=f"4px solid {rx.color('amber', 9)}",
+            background=_C.amber_2,
+            border_left=_BORDERS["amber", 9, 4],
             border_radius="var(--radius-3)"
         ),
         
@@ -2179,22 +2110,16 @@ def traditional_ml() -> rx.Component:
     )
 
 
+@cache
 def deep_learning_simple() -> rx.Component:
     """Deep learning simple models."""
-    dl_uni_data = [
-        ["MLP (Feedforward)", "0.960", "$100.62", "$78.85", "256->128->64->32 neurons, Dropout"],
-        ["GRU (One - One)", "0.843", "$164.93", "$122.95", "64->64 units, window=12"],
-        ["LSTM (One - One)", "0.603", "$262.55", "$193.85", "64->64 units, gates struggle"],
-        ["RNN (One - One)", "0.600", "$263.33", "$184.26", "Simple RNN insufficient"]
-    ]
-    
     return rx.vstack(
         comparison_table_section(
             "Deep Learning - (One - One) (Gold Price Only)",
             "Before using all 13 features, we test if deep learning can extract temporal patterns from gold price history alone. "
             "MLP (feedforward) performs well as it uses all features but no sequence. "
             "Recurrent models (RNN/LSTM/GRU) use sliding windows of past prices but struggle without external features.",
-            dl_uni_data
+            _DL_SIMPLE_ROWS
             # highlight_best=True
         ),
         
@@ -2211,8 +2136,8 @@ def deep_learning_simple() -> rx.Component:
                 line_height="1.7"
             ),
             padding="1em",
-            background=rx.color("blue", 2),
-            border_left=f"4px solid {rx.color('blue', 9)}",
+            background=_C.blue_2,
+            border_left=_BORDERS["blue", 9, 4],
             border_radius="var(--radius-3)",
             margin_bottom="1em"
         ),
@@ -2223,7 +2148,7 @@ def deep_learning_simple() -> rx.Component:
                 
                 rx.grid(
                     rx.vstack(
-                        rx.heading("MLP", size="3", weight="bold", color=rx.color("blue", 10)),
+                        rx.heading("MLP", size="3", weight="bold", color=_C.blue_10),
                         rx.text("Multilayer Perceptron (Feedforward)", size="2", color="var(--gray-10)", margin_bottom="0.5em"),
                         rx.unordered_list(
                             rx.list_item("Input: 13 features (all at once)"),
@@ -2235,488 +2160,105 @@ def deep_learning_simple() -> rx.Component:
                         ),
                         align="start"
                     ),
-                    rx.vstack(
-                        rx.heading("RNN/LSTM/GRU", size="3", weight="bold", color=rx.color("purple", 10)),
-                        rx.text("Recurrent Neural Networks", size="2", color="var(--gray-10)", margin_bottom="0.5em"),
-                        rx.unordered_list(
-                            rx.list_item("Input: Window of 12 past prices"),
-                            rx.list_item("Architecture: 64->64 recurrent units"),
-                            rx.list_item("Dropout: 0.2 between layers"),
-                            rx.list_item("Output: Dense(32)->Dense(1)"),
-                            spacing="1",
-                            padding_left="1em"
-                        ),
-                        align="start"
-                    ),
-                    columns="2",
-                    spacing="3",
-                    width="100%"
-                ),
-                
-                spacing="2",
-                align="start"
-            ),
-            padding="1.5em",
-            background=rx.color("gray", 1),
-            border="1px solid",
-            border_color=rx.color("gray", 5),
-            border_radius="var(--radius-3)",
-            margin_y="1em"
-        ),
-        
-        rx.box(
-            rx.vstack(
-                rx.hstack(
-                    rx.icon("brain", size=24, color=rx.color("purple", 9)),
-                    rx.heading("Why MLP Outperforms RNN/LSTM/GRU (simple)?", size="4", weight="bold"),
-                    spacing="2",
-                    align="center"
-                ),
-                rx.text(
-                    "MLP uses ",
-                    rx.text.strong("all 13 macroeconomic features"),
-                    " simultaneously (CPI, interest rates, S&P 500, etc.), while simple RNN/LSTM/GRU "
-                    "only see past gold prices. Without economic context, recurrent models struggle to predict sudden regime changes "
-                    "(e.g., 2008 crisis, COVID-19). This proves gold isn't just autoregressive - it ",
-                    rx.text.strong("needs external features"),
-                    "!",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
-                spacing="2",
-                align="start"
-            ),
-            padding="1.25em",
-            background=rx.color("purple", 2),
-            border_left=f"4px solid {rx.color('purple', 9)}",
-            border_radius="var(--radius-3)",
-            margin_bottom="1em"
-        ),
-        
-        rx.box(
-            rx.vstack(
-                rx.hstack(
-                    rx.icon("layers", size=24, color=rx.color("blue", 9)),
-                    rx.heading("LSTM vs GRU: The Gate Dilemma", size="4", weight="bold"),
-                    spacing="2",
-                    align="center"
-                ),
-                rx.text(
-                    "LSTM (",
-                    rx.text.strong("R² = 0.603"),
-                    ") and RNN (",
-                    rx.text.strong("R² = 0.600"),
-                    ") performed nearly identically and poorly. GRU (",
-                    rx.text.strong("R² = 0.843"),
-                    ") did better by using "
-                    "simpler gating mechanisms (",
-                    rx.text.strong("2 gates vs LSTM's 3"),
-                    "). With limited data (simple), LSTM's complexity became a liability. "
-                    "But this changes dramatically with Multiple inputs...",
-                    size="3",
-                    color="var(--gray-12)",
-                    line_height="1.7"
-                ),
-                spacing="2",
-                align="start"
-            ),
-            padding="1.25em",
-            background=rx.color("blue", 2),
-            border_left=f"4px solid {rx.color('blue', 9)}",
-            border_radius="var(--radius-3)",
-            margin_bottom="1.5em"
-        ),
-        
-        # Model Visualizations - Tabbed Interface
-        rx.heading("Model Training & Performance Visualizations", size="5", weight="bold", margin_bottom="1em", margin_top="1em"),
-        
-        rx.tabs.root(
-            rx.tabs.list(
-                rx.tabs.trigger("MLP", value="mlp"),
-                rx.tabs.trigger("RNN", value="rnn"),
-                rx.tabs.trigger("LSTM", value="lstm"),
-                rx.tabs.trigger("GRU", value="gru"),
-            ),
-            
-            # MLP Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("layers", size=24, color=rx.color("blue", 9)),
-                            rx.heading("MLP (Multilayer Perceptron) - R² = 0.960", size="4", weight="bold", color=rx.color("blue", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "Best simple performer using all 13 features simultaneously (256→128→64→32 architecture with Dropout & BatchNorm).",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        # Training History
-                        rx.vstack(
-                            rx.heading("Training History", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/mlp/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "MLP converges quickly with smooth loss reduction. Validation loss stabilizes around epoch 30, indicating good generalization.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        # Prediction vs Actual (2-column grid)
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/mlp/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Strong correlation between predicted and actual values (R² = 0.960).",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/mlp/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Regression line demonstrates MLP's ability to capture the full range of gold prices accurately.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("blue", 1),
-                    border="1px solid",
-                    border_color=rx.color("blue", 5),
-                    border_radius="var(--radius-4)"
-                ),
-                value="mlp"
-            ),
-            
-            # RNN Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("git-branch", size=24, color=rx.color("purple", 9)),
-                            rx.heading("RNN (Recurrent Neural Network) - R² = 0.600", size="4", weight="bold", color=rx.color("purple", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "Simple RNN struggles with vanishing gradients. Only sees past gold prices (window=12), lacks economic context.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/rnn/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "RNN struggles with vanishing gradients - loss plateaus early. Limited capacity to capture long-term dependencies.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/rnn/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Wide scatter indicates poor fit (R² = 0.600). RNN fails to capture gold's complex dynamics from price history alone.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/rnn/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Regression line deviates significantly from ideal y=x, confirming systematic prediction errors.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("purple", 1),
-                    border="1px solid",
-                    border_color=rx.color("purple", 5),
-                    border_radius="var(--radius-4)"
-                ),
-                value="rnn"
-            ),
-            
-            # LSTM Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("boxes", size=24, color=rx.color("green", 9)),
-                            rx.heading("LSTM (Long Short-Term Memory) - R² = 0.603", size="4", weight="bold", color=rx.color("green", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "LSTM's 3-gate architecture (input, forget, output) shows marginal improvement over RNN but still struggles without economic features.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/lstm/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "LSTM's gating mechanisms show slightly better convergence than RNN, but still struggles without economic features (R² = 0.603).",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/lstm/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "LSTM performs marginally better than RNN but still shows significant prediction errors without Multiple features.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/lstm/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Gates help with memory but cannot compensate for missing economic context. Fit remains poor.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("green", 1),
-                    border="1px solid",
-                    border_color=rx.color("green", 5),
-                    border_radius="var(--radius-4)"
-                ),
-                value="lstm"
-            ),
-            
-            # GRU Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("circuit-board", size=24, color=rx.color("amber", 9)),
-                            rx.heading("GRU (Gated Recurrent Unit) - R² = 0.843", size="4", weight="bold", color=rx.color("amber", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "Best simple recurrent model! GRU's simplified 2-gate design (reset + update) proves more effective than LSTM for limited data.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/gru/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "GRU achieves best simple performance (R² = 0.843) with efficient 2-gate architecture. Simpler than LSTM but more effective for limited data.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/gru/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Tighter cluster than RNN/LSTM, showing GRU's superior ability to learn temporal patterns from simple gold prices.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/gru/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Best simple recurrent model, but still limited without economic features. Sets stage for Multiple improvements.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
+                    rx.vstack(
+                        rx.heading("RNN/LSTM/GRU", size="3", weight="bold", color=_C.purple_10),
+                        rx.text("Recurrent Neural Networks", size="2", color="var(--gray-10)", margin_bottom="0.5em"),
+                        rx.unordered_list(
+                            rx.list_item("Input: Window of 12 past prices"),
+                            rx.list_item("Architecture: 64->64 recurrent units"),
+                            rx.list_item("Dropout: 0.2 between layers"),
+                            rx.list_item("Output: Dense(32)->Dense(1)"),
+                            spacing="1",
+                            padding_left="1em"
                         ),
-                        
-                        spacing="3",
                         align="start"
                     ),
-                    padding="1.5em",
-                    background=rx.color("amber", 1),
-                    border="1px solid",
-                    border_color=rx.color("amber", 5),
-                    border_radius="var(--radius-4)"
+                    columns="2",
+                    spacing="3",
+                    width="100%"
                 ),
-                value="gru"
+                
+                spacing="2",
+                align="start"
             ),
-            
+            padding="1.5em",
+            background=_C.gray_1,
+            border="1px solid",
+            border_color=_C.gray_5,
+            border_radius="var(--radius-3)",
+            margin_y="1em"
+        ),
+        
+        rx.box(
+            rx.vstack(
+                rx.hstack(
+                    rx.icon("brain", size=24, color=_C.purple_9),
+                    rx.heading("Why MLP Outperforms RNN/LSTM/GRU (simple)?", size="4", weight="bold"),
+                    spacing="2",
+                    align="center"
+                ),
+                rx.text(
+                    "MLP uses ",
+                    rx.text.strong("all 13 macroeconomic features"),
+                    " simultaneously (CPI, interest rates, S&P 500, etc.), while simple RNN/LSTM/GRU "
+                    "only see past gold prices. Without economic context, recurrent models struggle to predict sudden regime changes "
+                    "(e.g., 2008 crisis, COVID-19). This proves gold isn't just autoregressive - it ",
+                    rx.text.strong("needs external features"),
+                    "!",
+                    size="3",
+                    color="var(--gray-12)",
+                    line_height="1.7"
+                ),
+                spacing="2",
+                align="start"
+            ),
+            padding="1.25em",
+            background=_C.purple_2,
+            border_left=_BORDERS["purple", 9, 4],
+            border_radius="var(--radius-3)",
+            margin_bottom="1em"
+        ),
+        
+        rx.box(
+            rx.vstack(
+                rx.hstack(
+                    rx.icon("layers", size=24, color=_C.blue_9),
+                    rx.heading("LSTM vs GRU: The Gate Dilemma", size="4", weight="bold"),
+                    spacing="2",
+                    align="center"
+                ),
+                rx.text(
+                    "LSTM (",
+                    rx.text.strong("R² = 0.603"),
+                    ") and RNN (",
+                    rx.text.strong("R² = 0.600"),
+                    ") performed nearly identically and poorly. GRU (",
+                    rx.text.strong("R² = 0.843"),
+                    ") did better by using "
+                    "simpler gating mechanisms (",
+                    rx.text.strong("2 gates vs LSTM's 3"),
+                    "). With limited data (simple), LSTM's complexity became a liability. "
+                    "But this changes dramatically with Multiple inputs...",
+                    size="3",
+                    color="var(--gray-12)",
+                    line_height="1.7"
+                ),
+                spacing="2",
+                align="start"
+            ),
+            padding="1.25em",
+            background=_C.blue_2,
+            border_left=_BORDERS["blue", 9, 4],
+            border_radius="var(--radius-3)",
+            margin_bottom="1.5em"
+        ),
+        
+        # Model Visualizations - Tabbed Interface
+        rx.heading("Model Training & Performance Visualizations", size="5", weight="bold", margin_bottom="1em", margin_top="1em"),
+        
+        rx.tabs.root(
+            rx.tabs.list(*[rx.tabs.trigger(tab[1], value=tab[0]) for tab in _DL_SIMPLE_TABS]),
+            *[rx.tabs.content(_dl_model_tab(*tab[2:]), value=tab[0]) for tab in _DL_SIMPLE_TABS],
             default_value="mlp",
             width="100%"
         ),
@@ -2728,19 +2270,14 @@ def deep_learning_simple() -> rx.Component:
     )
 
 
+@cache
 def deep_learning_Multiple() -> rx.Component:
     """Deep learning Multiple models - achieving optimal performance."""
-    dl_multi_data = [
-        ["GRU (Many - One)", "0.990", "$45.92", "$34.94", "Optimal balance of performance"],
-        ["LSTM (Many - One)", "0.990", "$45.31", "$37.84", "Significant Improvement in MAE compare to LSTM(One - One)"],
-        ["RNN (Many - One)", "0.972", "$76.77", "$58.99", "Good but simpler architecture limits"]
-    ]
-    
     return rx.vstack(
         rx.box(
             rx.vstack(
                 rx.hstack(
-                    rx.icon("zap", size=32, color=rx.color("purple", 9)),
+                    rx.icon("zap", size=32, color=_C.purple_9),
                     rx.heading("Deep Learning (Many - One)", size="6", weight="bold"),
                     spacing="2",
                     align="center"
@@ -2765,8 +2302,8 @@ def deep_learning_Multiple() -> rx.Component:
                 align="start"
             ),
             padding="1.5em",
-            background=rx.color("amber", 2),
-            border_left=f"4px solid {rx.color('amber', 9)}",
+            background=_C.amber_2,
+            border_left=_BORDERS["amber", 9, 4],
             border_radius="var(--radius-3)",
             margin_bottom="1.5em"
         ),
@@ -2776,7 +2313,7 @@ def deep_learning_Multiple() -> rx.Component:
             "These models see both time patterns AND economic drivers simultaneously. "
             "Each timestep contains all features, allowing the model to learn "
             "how gold responds to changing economic conditions over time.",
-            dl_multi_data,
+            _DL_MULTI_ROWS,
         ),
         
         # Highlight key result
@@ -2792,85 +2329,31 @@ def deep_learning_Multiple() -> rx.Component:
                 line_height="1.7"
             ),
             padding="1em",
-            background=rx.color("purple", 2),
-            border_left=f"4px solid {rx.color('purple', 9)}",
+            background=_C.purple_2,
+            border_left=_BORDERS["purple", 9, 4],
             border_radius="var(--radius-3)",
             margin_bottom="1em"
         ),
         
-        rx.grid(
-            metric_card("R² Improvement", "+0.147", "green", "vs RNN simple"),
-            metric_card("Error Reduction", "-79%", "blue", "MAE: $184 -> $35"),
-            metric_card("Training Time", "~5 min", "purple", "70 epochs with EarlyStopping"),
-            metric_card("Parameters", "~50K", "amber", "128->64 GRU units"),
-            columns="4",
-            spacing="3",
-            width="100%",
-            margin_y="1.5em"
-        ),
+        _metric_grid(_DL_MULTI_METRICS, margin_y="1.5em"),
         
         rx.box(
             rx.vstack(
                 rx.heading("GRU Multiple", size="5", weight="bold", margin_bottom="1em"),
                 
-                rx.grid(
-                    rx.vstack(
-                        rx.text.strong("Input Layer"),
-                        rx.text("Shape: (batch, 12, 13)", size="2", color="var(--gray-12)"),
-                        rx.text("12 timesteps x 13 features", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.icon("arrow-right", size=24, color=rx.color("gray", 8)),
-                    rx.vstack(
-                        rx.text.strong("GRU Layer 1"),
-                        rx.text("128 units, return sequences", size="2", color="var(--gray-12)"),
-                        rx.text("Dropout: 0.2", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.icon("arrow-right", size=24, color=rx.color("gray", 8)),
-                    rx.vstack(
-                        rx.text.strong("GRU Layer 2"),
-                        rx.text("64 units, final state", size="2", color="var(--gray-12)"),
-                        rx.text("Captures long-term patterns", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.icon("arrow-right", size=24, color=rx.color("gray", 8)),
-                    rx.vstack(
-                        rx.text.strong("Dense Layers"),
-                        rx.text("Dense(32, ReLU) -> Dense(1)", size="2", color="var(--gray-12)"),
-                        rx.text("Final prediction", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    columns="7",
+                rx.hstack(
+                    *_pipeline(_GRU_MULTI_PIPELINE),
                     spacing="2",
-                    width="100%",
-                    align="center"
+                    align="center",
+                    flex_wrap="wrap",
+                    width="100%"
                 ),
                 
                 rx.divider(margin_y="1em"),
                 
                 rx.heading("Training Configuration", size="4", weight="bold", margin_top="0.5em", margin_bottom="0.5em"),
                 rx.grid(
-                    rx.vstack(
-                        rx.text.strong("Optimizer: Adam"),
-                        rx.text("Adaptive learning rate", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.vstack(
-                        rx.text.strong("Loss: MSE"),
-                        rx.text("Mean Squared Error", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.vstack(
-                        rx.text.strong("Callbacks: 3"),
-                        rx.text("EarlyStopping, ReduceLR, Checkpoint", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
-                    rx.vstack(
-                        rx.text.strong("Batch Size: 32"),
-                        rx.text("Balanced speed/stability", size="2", color="var(--gray-10)"),
-                        align="start"
-                    ),
+                    *[_term_item(*term, muted=True) for term in _GRU_MULTI_TRAINING],
                     columns="4",
                     spacing="3",
                     width="100%"
@@ -2880,9 +2363,9 @@ def deep_learning_Multiple() -> rx.Component:
                 align="start"
             ),
             padding="1.5em",
-            background=rx.color("purple", 1),
+            background=_C.purple_1,
             border="1px solid",
-            border_color=rx.color("purple", 5),
+            border_color=_C.purple_5,
             border_radius="var(--radius-4)",
             margin_y="1.5em"
         ),
@@ -2891,298 +2374,8 @@ def deep_learning_Multiple() -> rx.Component:
         rx.heading("Training & Performance Visualizations", size="5", weight="bold", margin_bottom="1em", margin_top="1em"),
         
         rx.tabs.root(
-            rx.tabs.list(
-                rx.tabs.trigger("RNN", value="rnn_multi"),
-                rx.tabs.trigger("LSTM", value="lstm_multi"),
-                rx.tabs.trigger("GRU 🏆", value="gru_multi"),
-            ),
-            
-            # RNN Multiple Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("git-branch", size=24, color=rx.color("purple", 9)),
-                            rx.heading("RNN Multiple - R² = 0.972", size="4", weight="bold", color=rx.color("purple", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "RNN dramatically improves from R² = 0.600 (simple) to 0.972 (Multiple) with economic features. MAE drops from $184 to $59.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/rnn_multivariate/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "Economic features stabilize training and reduce vanishing gradient issues. Convergence is much smoother than simple RNN.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/rnn_multivariate/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Much tighter cluster than simple RNN. Multiple features enable RNN to capture complex gold dynamics.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/rnn_multivariate/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Strong linear relationship demonstrates RNN's improved prediction accuracy with economic context (MAE = $58.99).",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("purple", 1),
-                    border="1px solid",
-                    border_color=rx.color("purple", 5),
-                    border_radius="var(--radius-4)"
-                ),
-                value="rnn_multi"
-            ),
-            
-            # LSTM Multiple Tab
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("boxes", size=24, color=rx.color("green", 9)),
-                            rx.heading("LSTM Multiple - R² = 0.990", size="4", weight="bold", color=rx.color("green", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            "LSTM achieves near-optimal performance (R² = 0.990, MAE = $37.84). Three-gate architecture excels at managing long-term dependencies across 13 features.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/lstm_multivariate/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="1px solid",
-                                border_color=rx.color("gray", 5)
-                            ),
-                            rx.text(
-                                "Smooth convergence with excellent validation performance. LSTM's memory cells effectively integrate economic signals over time.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/lstm_multivariate/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Extremely tight scatter along diagonal - LSTM captures gold price variations with exceptional accuracy (MAE = $37.84).",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/lstm_multivariate/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="1px solid",
-                                    border_color=rx.color("gray", 5)
-                                ),
-                                rx.text(
-                                    "Near-perfect alignment with y=x ideal line. LSTM's gates (input, forget, output) manage complex feature interactions.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("green", 1),
-                    border="1px solid",
-                    border_color=rx.color("green", 5),
-                    border_radius="var(--radius-4)"
-                ),
-                value="lstm_multi"
-            ),
-            
-            # GRU Multiple Tab (CHAMPION!)
-            rx.tabs.content(
-                rx.box(
-                    rx.vstack(
-                        rx.hstack(
-                            rx.icon("trophy", size=28, color=rx.color("amber", 9)),
-                            rx.heading("GRU Multiple - CHAMPION (R² = 0.990)", size="4", weight="bold", color=rx.color("amber", 10)),
-                            spacing="2",
-                            align="center",
-                            margin_bottom="0.5em"
-                        ),
-                        rx.text(
-                            rx.text.strong("Best overall model! "),
-                            "R² = 0.990, MAE = $34.94 (lowest error of all models). GRU's 2-gate architecture achieves optimal balance: complex enough to excel, efficient enough to train ~20% faster than LSTM.",
-                            size="2",
-                            color="var(--gray-11)",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.vstack(
-                            rx.heading("Training Loss", size="3", weight="bold", margin_bottom="0.5em"),
-                            rx.image(
-                                src="/modeling_plots/gru_multivariate/training_loss.png",
-                                width="100%",
-                                border_radius="var(--radius-3)",
-                                border="2px solid",
-                                border_color=rx.color("amber", 6)
-                            ),
-                            rx.text(
-                                rx.text.strong("Optimal training efficiency. "),
-                                "GRU's simplified design (reset + update gates) converges smoothly while capturing all essential temporal patterns.",
-                                size="2",
-                                color="var(--gray-11)",
-                                text_align="center",
-                                margin_top="0.5em"
-                            ),
-                            spacing="2",
-                            margin_bottom="1em"
-                        ),
-                        
-                        rx.grid(
-                            rx.vstack(
-                                rx.heading("Predictions vs Actual", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/gru_multivariate/pred_actual.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="2px solid",
-                                    border_color=rx.color("amber", 6)
-                                ),
-                                rx.text(
-                                    rx.text.strong("Tightest cluster of all models! "),
-                                    "Lowest MAE ($34.94) demonstrates GRU's superior generalization across all price ranges.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            rx.vstack(
-                                rx.heading("Linear Fit Analysis", size="3", weight="bold", margin_bottom="0.5em"),
-                                rx.image(
-                                    src="/modeling_plots/gru_multivariate/pred_actual_linefit.png",
-                                    width="100%",
-                                    border_radius="var(--radius-3)",
-                                    border="2px solid",
-                                    border_color=rx.color("amber", 6)
-                                ),
-                                rx.text(
-                                    rx.text.strong("Perfect regression line! "),
-                                    "GRU learned how CPI, interest rates, VIX, and 10 other features drive gold prices across the full historical range.",
-                                    size="2",
-                                    color="var(--gray-11)",
-                                    text_align="center",
-                                    margin_top="0.5em"
-                                ),
-                                spacing="2",
-                                align="start"
-                            ),
-                            columns="2",
-                            spacing="3",
-                            width="100%"
-                        ),
-                        
-                        spacing="3",
-                        align="start"
-                    ),
-                    padding="1.5em",
-                    background=rx.color("amber", 1),
-                    border="2px solid",
-                    border_color=rx.color("amber", 6),
-                    border_radius="var(--radius-4)"
-                ),
-                value="gru_multi"
-            ),
-            
+            rx.tabs.list(*[rx.tabs.trigger(tab[1], value=tab[0]) for tab in _DL_MULTI_TABS]),
+            *[rx.tabs.content(_dl_model_tab(*tab[2:]), value=tab[0]) for tab in _DL_MULTI_TABS],
             default_value="gru_multi",
             width="100%"
         ),
@@ -3191,7 +2384,7 @@ def deep_learning_Multiple() -> rx.Component:
 
             rx.vstack(
                 rx.hstack(
-                    rx.icon("zap", size=24, color=rx.color("amber", 9)),
+                    rx.icon("zap", size=24, color=_C.amber_9),
                     rx.heading("Why GRU Wins Over LSTM", size="4", weight="bold"),
                     spacing="2",
                     align="center"
@@ -3219,8 +2412,8 @@ def deep_learning_Multiple() -> rx.Component:
                 align="start"
             ),
             padding="1.25em",
-            background=rx.color("amber", 2),
-            border_left=f"4px solid {rx.color('amber', 9)}",
+            background=_C.amber_2,
+            border_left=_BORDERS["amber", 9, 4],
             border_radius="var(--radius-3)",
             margin_bottom="1em"
         ),
@@ -3228,7 +2421,7 @@ def deep_learning_Multiple() -> rx.Component:
         rx.box(
             rx.vstack(
                 rx.hstack(
-                    rx.icon("trending-up", size=24, color=rx.color("green", 9)),
+                    rx.icon("trending-up", size=24, color=_C.green_9),
                     rx.heading("The Multiple Advantage", size="4", weight="bold"),
                     spacing="2",
                     align="center"
@@ -3255,8 +2448,8 @@ def deep_learning_Multiple() -> rx.Component:
                 align="start"
             ),
             padding="1.25em",
-            background=rx.color("green", 2),
-            border_left=f"4px solid {rx.color('green', 9)}",
+            background=_C.green_2,
+            border_left=_BORDERS["green", 9, 4],
             border_radius="var(--radius-3)"
         ),
         
@@ -3267,25 +2460,9 @@ def deep_learning_Multiple() -> rx.Component:
     )
 
 
+@cache
 def grand_comparison() -> rx.Component:
     """Final comparison of all models."""
-    all_models_data = [
-        ["GRU Multiple", "0.990", "$45.92", "$34.94", "Top performer - best overall"],
-        ["LSTM Multiple", "0.990", "$45.31", "$37.84", "Nearly tied with GRU"],
-        ["SVR (RBF Kernel)", "0.986", "$59.93", "$43.77", "Best traditional ML"],
-        ["Random Forest", "0.986", "$59.93", "$43.77", "Tied with SVR"],
-        ["XGBoost", "0.973", "$82.67", "$51.11", "Gradient boosting"],
-        ["RNN Multiple", "0.972", "$76.77", "$58.99", "Good but simpler"],
-        ["MLP", "0.960", "$100.62", "$78.85", "Feedforward baseline"],
-        ["Linear Regression", "0.947", "$115.88", "$77.06", "Strong baseline"],
-        ["Ridge Regression", "0.947", "$115.88", "$77.06", "No improvement"],
-        ["GRU simple", "0.843", "$164.93", "$122.95", "Needs features"],
-        ["LSTM simple", "0.603", "$262.55", "$193.85", "Insufficient"],
-        ["RNN simple", "0.600", "$263.33", "$184.26", "Insufficient"],
-        ["SARIMA", "0.270", "$353.57", "$233.26", "Time series weak"],
-        ["ARIMA", "-0.480", "$503.12", "$321.93", "Failed completely"]
-    ]
-    
     return rx.vstack(
         rx.heading("Grand Comparison: All 14 Models Ranked", size="7", weight="bold", margin_bottom="1em"),
         
@@ -3318,28 +2495,21 @@ def grand_comparison() -> rx.Component:
             ),
             rx.table.body(
                 *[
-                    rx.table.row(
-                        rx.table.cell(str(i+1)),
-                        rx.table.cell(row[0]),
-                        rx.table.cell(rx.badge(row[1], color_scheme="green" if i < 2 else ("blue" if i < 5 else "gray"), size="2")),
-                        rx.table.cell(row[2]),
-                        rx.table.cell(row[3]),
-                        rx.table.cell(row[4]),
-                        style={
-                            "background": rx.color("green", 2) if i < 2 else "transparent",
-                            "font_weight": "bold" if i < 2 else "normal"
-                        }
-                    )
-                    for i, row in enumerate(all_models_data)
+                    _leaderboard_row(rank, *row, *tier)
+                    for rank, (row, tier) in enumerate(zip(_ALL_MODELS_ROWS, _ALL_MODELS_TIERS), start=1)
                 ]
             ),
             variant="surface",
             size="3",
             width="100%"
         ),
-    ),
+        spacing="3",
+        align="start",
+        width="100%"
+    )
 
 
+@cache
 def key_takeaways() -> rx.Component:
     """Key learnings and insights."""
     return rx.vstack(
@@ -3425,16 +2595,7 @@ def key_takeaways() -> rx.Component:
                         line_height="1.7",
                         margin_bottom="0.5em"
                     ),
-                    rx.unordered_list(
-                        rx.list_item("Ensemble methods: Stack top 3 models (GRU, LSTM, Random Forest) for robustness"),
-                        rx.list_item("Attention mechanisms: Add attention layers to GRU to identify key timesteps"),
-                        rx.list_item("Hyperparameter tuning: Use Optuna for automated Bayesian optimization"),
-                        rx.list_item("Cross-validation: Implement time-series CV instead of single train/test split"),
-                        rx.list_item("Regime detection: Train separate models for bull/bear/crisis periods"),
-                        rx.list_item("Exogenous shocks: Add binary flags for major events (Fed pivots, crises)"),
-                        spacing="2",
-                        padding_left="1.5em"
-                    ),
+                    _md_list(_HINDSIGHT_MD),
                     spacing="2",
                     align="start"
                 ),
@@ -3451,12 +2612,13 @@ def key_takeaways() -> rx.Component:
     )
 
 
+@cache
 def whats_next() -> rx.Component:
     """Transition to forecasting chapter."""
     return rx.box(
         rx.vstack(
             rx.hstack(
-                rx.icon("rocket", size=32, color=rx.color("amber", 9)),
+                rx.icon("rocket", size=32, color=_C.amber_9),
                 rx.heading("What's Next: Forecasting & Deployment", size="6", weight="bold"),
                 spacing="2",
                 align="center"
@@ -3521,8 +2683,8 @@ def whats_next() -> rx.Component:
             align="start"
         ),
         padding="1.5em",
-        background=rx.color("amber", 2),
-        border_left=f"4px solid {rx.color('amber', 9)}",
+        background=_C.amber_2,
+        border_left=_BORDERS["amber", 9, 4],
         border_radius="var(--radius-3)",
         margin_y="2em"
     )
@@ -3560,43 +2722,43 @@ def modeling_page() -> rx.Component:
                 ),
                 
                 executive_summary(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 modeling_philosophy(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 simple_regression_detail(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 polynomial_regression_section(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 time_series_section(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 Multiple_regression_detail(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 ridge_regression_detail(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 baseline_models(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 traditional_ml(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 deep_learning_simple(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 deep_learning_Multiple(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 grand_comparison(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 key_takeaways(),
-                section_divider(),
+                _SECTION_DIVIDER,
                 
                 whats_next(),
                 